@@ -6,34 +6,79 @@ factory pattern to create and configure the Flask application instance.
 """
 
 import os
-from urllib.parse import urlparse
+import sqlite3
 
+import redis
 from flask import Flask
 from flask_caching import Cache
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 from prometheus_flask_exporter import PrometheusMetrics
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 
 from .auth import auth_manager
+from .utils.audit_writer import audit_writer
+from .utils.json_provider import OrjsonProvider
 
 db = SQLAlchemy()
+migrate = Migrate(db=db)
 metrics = PrometheusMetrics(app=None)
-auth_manager = auth_manager
 
-# Parse Redis URL for configuration
 redis_url = os.environ.get("REDIS_URL", "redis://redis:6379/0")
-redis_parts = urlparse(redis_url)
 
-# Initialize limiter with Redis storage
+# Single connection pool shared by the limiter and the cache
+redis_pool = redis.ConnectionPool.from_url(redis_url, max_connections=int(os.environ.get("REDIS_MAX_CONNECTIONS", "64")))
+redis_client = redis.Redis(connection_pool=redis_pool)
+
+# Initialize limiter with Redis storage. The moving-window strategy avoids the 2x burst
+# fixed windows allow at boundaries and is evaluated atomically by a Lua script per hit.
 limiter = Limiter(
     key_func=get_remote_address,
     default_limits=["200 per day", "50 per hour"],
-    storage_uri=redis_url,
+    strategy="moving-window",
+    storage_uri="redis://",
+    storage_options={"connection_pool": redis_pool},
 )
 
-# Initialize cache with Redis
-cache = Cache(config={"CACHE_TYPE": "redis", "CACHE_REDIS_URL": redis_url, "CACHE_DEFAULT_TIMEOUT": 300})
+# Initialize cache with Redis; passing a client as the host makes the backend reuse its pool
+cache = Cache(config={"CACHE_TYPE": "redis", "CACHE_REDIS_HOST": redis_client, "CACHE_DEFAULT_TIMEOUT": 300})
+
+
+@event.listens_for(Engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """Enforce foreign keys on SQLite connections, which is off by default.
+
+    Cluster deletes rely on ON DELETE CASCADE to remove dependent rows.
+    """
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+# Extensions in initialization order; each is registered exactly once per app. The cache
+# comes before auth_manager, whose init_app prewarms it.
+_EXTENSIONS = (db, migrate, metrics, cache, auth_manager, limiter, audit_writer)
+
+# Configuration loaded from the Kubernetes ConfigMap as (key, default) pairs
+_ENV_KEYS = (
+    ("GITHUB_TOKEN", None),
+    ("PLAYBOOKS_DIR", "/playbooks"),
+    ("VAULT_ADDR", None),
+    ("OKTA_ISSUER", None),
+    ("OKTA_CLIENT_ID", None),
+    ("OKTA_AUDIENCE", None),
+    ("KEYCLOAK_URL", None),
+    ("KEYCLOAK_REALM", None),
+    ("KEYCLOAK_CLIENT_ID", None),
+    ("KEYCLOAK_CLIENT_SECRET", None),
+    ("KEYCLOAK_JWKS_TTL", "3600"),
+    ("AUTH_CACHE_TTL", "60"),
+    ("AUTH_PREWARM", "1"),
+)
 
 
 def create_app(environment=None):
@@ -51,6 +96,7 @@ def create_app(environment=None):
         Flask: A configured Flask application instance ready for use.
     """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
 
     # Configure SQLAlchemy
     if environment == "testing":
@@ -58,23 +104,34 @@ def create_app(environment=None):
     else:
         app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///app.db"
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    if environment != "testing":
+        # Bound connections per worker and drop stale ones before use; the in-memory test
+        # database uses a single-connection pool that takes none of these options.
+        # A worker holds at most one connection per request thread (2) plus the audit writer,
+        # so 3 + 2 overflow covers it. The ceiling is (pool_size + max_overflow) x workers x
+        # replicas: 5 x 4 x 3 (HPA maximum) = 60, inside PostgreSQL's default max_connections
+        # of 100 with room for migrations and admin sessions.
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            "pool_size": int(os.environ.get("DB_POOL_SIZE", "3")),
+            "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", "2")),
+            "pool_timeout": 30,
+            "pool_recycle": 3600,
+            "pool_pre_ping": True,
+        }
+
+    # Schema is managed by migrations outside of tests; creating tables in every worker
+    # only repeats table introspection on startup
+    app.config["AUTO_CREATE_TABLES"] = environment == "testing" or os.environ.get("INIT_DB") == "1"
 
     # Configure Redis for caching and rate limiting
-    app.config.update({"CACHE_TYPE": "redis", "CACHE_REDIS_URL": redis_url, "CACHE_DEFAULT_TIMEOUT": 300, "REDIS_URL": redis_url})
+    app.config.update({"CACHE_TYPE": "redis", "CACHE_REDIS_HOST": redis_client, "CACHE_DEFAULT_TIMEOUT": 300, "REDIS_URL": redis_url})
+
+    # Load configuration from Kubernetes ConfigMap before extensions read it
+    app.config.update({key: os.environ.get(key, default) for key, default in _ENV_KEYS})
 
     # Initialize extensions
-    db.init_app(app)
-    metrics.init_app(app)
-    auth_manager.init_app(app)
-    limiter.init_app(app)
-    cache.init_app(app)
-
-    # Load configuration from Kubernetes ConfigMap
-    app.config["GITHUB_TOKEN"] = os.environ.get("GITHUB_TOKEN")
-    app.config["PLAYBOOKS_DIR"] = os.environ.get("PLAYBOOKS_DIR", "/playbooks")
-    app.config["VAULT_ADDR"] = os.environ.get("VAULT_ADDR")
-    app.config["OKTA_ISSUER"] = os.environ.get("OKTA_ISSUER")
-    app.config["OKTA_CLIENT_ID"] = os.environ.get("OKTA_CLIENT_ID")
+    for extension in _EXTENSIONS:
+        extension.init_app(app)
 
     with app.app_context():
         # Import routes
@@ -83,6 +140,7 @@ def create_app(environment=None):
         app.register_blueprint(routes.bp, url_prefix="/api/v1")
 
         # Create database tables
-        db.create_all()
+        if app.config["AUTO_CREATE_TABLES"]:
+            db.create_all()
 
     return app
@@ -7,26 +7,127 @@ providers based on configuration.
 Environment Variables:
     OKTA_ISSUER: The Okta issuer URL (required for Okta)
     OKTA_CLIENT_ID: The Okta client ID (required for Okta)
+    OKTA_AUDIENCE: Expected access token audience for Okta (defaults to api://default)
     KEYCLOAK_URL: The Keycloak server URL (required for Keycloak)
     KEYCLOAK_CLIENT_ID: The Keycloak client ID (required for Keycloak)
     KEYCLOAK_REALM: The Keycloak realm name (required for Keycloak)
     KEYCLOAK_CLIENT_SECRET: The Keycloak client secret (required for Keycloak)
 """
 
-from functools import wraps
-from typing import Any, Dict, Optional
-
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
+
+import jwt
+import orjson
 import requests
-from flask import current_app, g, request
-from keycloak import KeycloakOpenID
-from okta_jwt_verifier import JWTVerifier
+from cachetools import TTLCache
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
+from flask import g, request
+from jwt.utils import base64url_decode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from werkzeug.exceptions import Unauthorized
+from werkzeug.local import LocalProxy
 
 from .logging_config import configure_logging
 
 # Configure logging
 logger = configure_logging()
 
+# WSGI environ key holding the verified claims for the current request
+_CLAIMS_ENVIRON_KEY = "pxbackup.auth.claims"
+
+_BEARER_PREFIX = "Bearer "
+_BEARER_PREFIX_LOWER = _BEARER_PREFIX.lower()
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
+
+
+def _bearer_token(auth_header: Optional[str]) -> str:
+    """Extract the token from an ``Authorization: Bearer`` header.
+
+    Args:
+        auth_header (Optional[str]): The raw Authorization header value.
+
+    Returns:
+        str: The bearer token.
+
+    Raises:
+        Unauthorized: If the header is missing, not a bearer credential, or has an empty token.
+    """
+    if not auth_header:
+        raise Unauthorized("No authorization header")
+    # Clients almost always send the canonical casing; only lowercase on a mismatch
+    if not auth_header.startswith(_BEARER_PREFIX) and auth_header[:_BEARER_PREFIX_LEN].lower() != _BEARER_PREFIX_LOWER:
+        raise Unauthorized("Invalid authorization header format")
+    token = auth_header[_BEARER_PREFIX_LEN:].strip()
+    if not token:
+        raise Unauthorized("Invalid authorization header format")
+    return token
+
+
+def _shared_cache_get(key: str) -> Any:
+    """Read a JSON value from the shared cache, treating backend errors as a miss.
+
+    Args:
+        key (str): The cache key.
+
+    Returns:
+        Any: The cached value, or None if absent or the cache is unavailable.
+    """
+    from . import cache
+
+    try:
+        raw = cache.get(key)
+    except Exception as e:
+        logger.warning("Auth cache lookup failed", error=e)
+        return None
+    return None if raw is None else orjson.loads(raw)
+
+
+def _shared_cache_set(key: str, value: Any, timeout: int) -> None:
+    """Store a JSON-serializable value in the shared cache, ignoring backend errors.
+
+    Values are encoded with orjson, which is smaller and faster to round-trip
+    than pickling the dict.
+
+    Args:
+        key (str): The cache key.
+        value (Any): The value to store.
+        timeout (int): Expiry in seconds.
+    """
+    from . import cache
+
+    try:
+        cache.set(key, orjson.dumps(value), timeout=timeout)
+    except Exception as e:
+        logger.warning("Auth cache update failed", error=e)
+
+
+@lru_cache(maxsize=64)
+def _header_kid(header_segment: str) -> Optional[str]:
+    """Return the ``kid`` from the encoded header segment of a JWT.
+
+    Every token signed with the same key shares the same header segment, so the
+    base64/JSON decode is memoized per segment instead of repeated per request.
+
+    Args:
+        header_segment (str): The first dot-separated segment of the token.
+
+    Returns:
+        Optional[str]: The key ID, or None if the header has none.
+    """
+    header = json.loads(base64url_decode(header_segment))
+    if not isinstance(header, dict):
+        raise jwt.DecodeError("Invalid token header")
+    return header.get("kid")
+
 
 class AuthProvider:
     """Abstract base class for authentication providers.
@@ -36,16 +137,18 @@ class AuthProvider:
 
     Methods:
         create_provider: Factory method to create authentication provider instances.
+        prewarm: Fetch verification material before the first request.
         verify_token: Abstract method to verify JWT tokens.
         get_user_info: Abstract method to retrieve user information.
     """
 
     @staticmethod
-    def create_provider(provider_type: str) -> "AuthProvider":
+    def create_provider(provider_type: str, app) -> "AuthProvider":
         """Create an authentication provider instance.
 
         Args:
             provider_type (str): Type of provider to create ('okta', 'keycloak', or 'mock').
+            app (Flask): Flask application whose configuration the provider reads.
 
         Returns:
             AuthProvider: An instance of the appropriate authentication provider.
@@ -53,14 +156,18 @@ class AuthProvider:
         Raises:
             ValueError: If an invalid provider type is specified.
         """
-        if provider_type == "okta":
-            return OktaAuthProvider()
-        elif provider_type == "keycloak":
-            return KeycloakAuthProvider()
-        elif provider_type == "mock":
-            return MockAuthProvider()
-        else:
-            raise ValueError(f"Invalid auth provider type: {provider_type}")
+        try:
+            provider_class = _PROVIDERS[provider_type.lower()]
+        except KeyError:
+            raise ValueError(f"Invalid auth provider type: {provider_type}") from None
+        return provider_class(app)
+
+    def prewarm(self) -> None:
+        """Fetch verification material ahead of the first request.
+
+        Providers that need signing keys override this so the first authenticated
+        request does not pay for the fetch. The default does nothing.
+        """
 
 
 class MockAuthProvider(AuthProvider):
@@ -69,6 +176,13 @@ class MockAuthProvider(AuthProvider):
     This provider allows all tokens in testing environment and returns mock user info.
     """
 
+    def __init__(self, app=None):
+        """Initialize the mock auth provider.
+
+        Args:
+            app (Flask, optional): Flask application instance (unused).
+        """
+
     def verify_token(self, token: str) -> Dict[str, Any]:
         """Verify a mock token.
 
@@ -106,22 +220,85 @@ class OktaAuthProvider:
     """Okta-specific authentication provider.
 
     This class implements the AuthProvider interface for Okta authentication.
-    It handles token verification and user information retrieval using Okta's APIs.
+    Tokens are verified locally against the issuer's JWKS, which is cached in-process.
 
     Attributes:
         REQUEST_TIMEOUT (int): Timeout for HTTP requests to Okta.
+        JWKS_TTL (int): Seconds before the cached JWKS is re-fetched.
+        JWKS_MIN_REFRESH_INTERVAL (int): Minimum seconds between refreshes triggered by an unknown ``kid``.
         issuer (str): The Okta issuer URL.
         client_id (str): The Okta client ID.
-        jwt_verifier (JWTVerifier): Instance of Okta's JWT verification utility.
+        audience (str): Expected ``aud`` claim of access tokens.
+        session (requests.Session): Pooled keep-alive session for calls to the issuer.
     """
 
     REQUEST_TIMEOUT = 30
+    JWKS_TTL = 3600
+    JWKS_MIN_REFRESH_INTERVAL = 30
+    _DECODE_OPTIONS = MappingProxyType({"require": ["exp", "iat", "sub"]})
+
+    def __init__(self, app):
+        """Initialize the Okta auth provider with configuration from Flask app.
+
+        Args:
+            app (Flask): Flask application instance.
+        """
+        self.issuer = app.config["OKTA_ISSUER"]
+        self.client_id = app.config["OKTA_CLIENT_ID"]
+        self.audience = app.config.get("OKTA_AUDIENCE") or "api://default"
+        self._jwks_client = jwt.PyJWKClient(
+            f"{self.issuer}/v1/keys",
+            cache_keys=True,
+            lifespan=self.JWKS_TTL,
+            timeout=self.REQUEST_TIMEOUT,
+        )
+        self._jwks_refreshed_at = float("-inf")
+        self._jwks_lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers.update({"Accept": "application/json"})
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=32,
+                max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+            ),
+        )
 
-    def __init__(self):
-        """Initialize the Okta auth provider with configuration from Flask app."""
-        self.issuer = current_app.config["OKTA_ISSUER"]
-        self.client_id = current_app.config["OKTA_CLIENT_ID"]
-        self.jwt_verifier = JWTVerifier(issuer=self.issuer, client_id=self.client_id)
+    def prewarm(self) -> None:
+        """Load the Okta JWKS into the client's cache."""
+        self._jwks_client.get_jwk_set()
+
+    def _find_signing_key(self, kid: Optional[str]) -> jwt.PyJWK:
+        """Return the cached signing key for ``kid``, refreshing the JWKS when needed.
+
+        PyJWKClient re-fetches the JWKS on every unknown ``kid``, so tokens with made-up
+        key IDs would each cost a request to Okta. Forced refreshes are limited to one
+        per ``JWKS_MIN_REFRESH_INTERVAL``; unknown keys in between are rejected.
+
+        Args:
+            kid (Optional[str]): Key ID from the token header.
+
+        Returns:
+            jwt.PyJWK: The issuer key used to sign the token.
+
+        Raises:
+            KeyError: If the key is unknown even after a refresh.
+        """
+        for key in self._jwks_client.get_signing_keys():
+            if key.key_id == kid:
+                return key
+
+        # Keys may have been rotated since the last fetch
+        with self._jwks_lock:
+            if time.monotonic() - self._jwks_refreshed_at < self.JWKS_MIN_REFRESH_INTERVAL:
+                raise KeyError(kid)
+            self._jwks_refreshed_at = time.monotonic()
+        for key in self._jwks_client.get_signing_keys(refresh=True):
+            if key.key_id == kid:
+                return key
+        raise KeyError(kid)
 
     def verify_token(self, token: str) -> Dict[str, Any]:
         """Verify an Okta JWT token.
@@ -136,11 +313,21 @@ class OktaAuthProvider:
             Unauthorized: If the token is invalid or expired.
         """
         try:
-            claims = self.jwt_verifier.verify(token)
-            return claims
+            signing_key = self._find_signing_key(jwt.get_unverified_header(token).get("kid"))
+            claims = jwt.decode(
+                token,
+                signing_key.key,
+                algorithms=["RS256"],
+                audience=self.audience,
+                issuer=self.issuer,
+                options=self._DECODE_OPTIONS,
+            )
         except Exception as e:
-            logger.error("Token verification failed", error=str(e))
-            raise Unauthorized("Invalid token")
+            raise Unauthorized("Invalid token") from e
+
+        if claims.get("cid", self.client_id) != self.client_id:
+            raise Unauthorized("Invalid token") from ValueError("client ID mismatch")
+        return claims
 
     def get_user_info(self, token: str) -> Dict[str, Any]:
         """Get user information from Okta.
@@ -156,15 +343,15 @@ class OktaAuthProvider:
         """
         try:
             headers = {"Authorization": f"Bearer {token}"}
-            response = requests.get(
+            response = self.session.get(
                 f"{self.issuer}/v1/userinfo",
                 headers=headers,
                 timeout=self.REQUEST_TIMEOUT,
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
-            logger.error("Failed to get user info", error=str(e))
+            logger.error("Failed to get user info", error=e)
             raise Unauthorized("Failed to get user info")
 
 
@@ -174,18 +361,108 @@ class KeycloakAuthProvider:
     This class implements the AuthProvider interface for Keycloak authentication.
     It handles token verification and user information retrieval using Keycloak's APIs.
 
+    Realm signing keys are fetched from the JWKS endpoint once and kept in a dict
+    keyed by ``kid``, so verifying a token is a single lookup instead of a network
+    call plus a key parse.
+
     Attributes:
+        JWKS_TTL (int): Default seconds before the cached signing keys are refreshed.
+        JWKS_MIN_REFRESH_INTERVAL (int): Minimum seconds between refreshes triggered by an unknown ``kid``.
+        jwks_ttl (int): Configured refresh interval, from ``KEYCLOAK_JWKS_TTL``.
         keycloak_openid (KeycloakOpenID): Instance of Keycloak's OpenID client.
     """
 
-    def __init__(self):
-        """Initialize the Keycloak auth provider with configuration from Flask app."""
+    JWKS_TTL = 3600
+    JWKS_MIN_REFRESH_INTERVAL = 30
+    # Asymmetric algorithms a realm key may declare; anything else (e.g. HS256 or none) is never accepted
+    _SIGNING_ALGORITHMS = frozenset({"RS256", "RS384", "RS512", "PS256", "PS384", "PS512", "ES256", "ES384", "ES512"})
+    _DECODE_OPTIONS = MappingProxyType({"verify_signature": True, "verify_aud": False})
+
+    def __init__(self, app):
+        """Initialize the Keycloak auth provider with configuration from Flask app.
+
+        Args:
+            app (Flask): Flask application instance.
+        """
+        from keycloak import KeycloakOpenID
+
         self.keycloak_openid = KeycloakOpenID(
-            server_url=current_app.config["KEYCLOAK_URL"],
-            client_id=current_app.config["KEYCLOAK_CLIENT_ID"],
-            realm_name=current_app.config["KEYCLOAK_REALM"],
-            client_secret_key=current_app.config["KEYCLOAK_CLIENT_SECRET"],
+            server_url=app.config["KEYCLOAK_URL"],
+            client_id=app.config["KEYCLOAK_CLIENT_ID"],
+            realm_name=app.config["KEYCLOAK_REALM"],
+            client_secret_key=app.config["KEYCLOAK_CLIENT_SECRET"],
         )
+        self.jwks_ttl = int(app.config.get("KEYCLOAK_JWKS_TTL", self.JWKS_TTL))
+        self._jwks_cache_key = f"jwks:keycloak:{app.config['KEYCLOAK_REALM']}"
+        self._jwks_keys: Dict[str, Tuple[jwt.PyJWK, str]] = {}
+        self._jwks_fetched_at = float("-inf")
+        self._jwks_lock = threading.Lock()
+        self._realm_key: Optional[RSAPublicKey] = None
+        self._realm_key_fetched_at = float("-inf")
+
+    def prewarm(self) -> None:
+        """Load the realm signing keys into the JWKS cache."""
+        self._refresh_jwks(self.jwks_ttl)
+
+    def _refresh_jwks(self, max_age: float, use_shared: bool = True) -> None:
+        """Re-fetch the realm JWKS if the cached copy is older than ``max_age``.
+
+        The age is re-checked under the lock so concurrent callers that miss at the
+        same time only trigger a single fetch. The JWKS document is also kept in the
+        shared cache so that other workers can reuse it instead of calling Keycloak.
+
+        Args:
+            max_age (float): Maximum acceptable age of the cached keys in seconds.
+            use_shared (bool): Whether a copy from the shared cache may be used. Defaults to True.
+        """
+        with self._jwks_lock:
+            if time.monotonic() - self._jwks_fetched_at < max_age:
+                return
+            jwks = _shared_cache_get(self._jwks_cache_key) if use_shared else None
+            if jwks is None:
+                jwks = self.keycloak_openid.certs()
+                _shared_cache_set(self._jwks_cache_key, jwks, self.jwks_ttl)
+            # Realms also publish encryption keys; only signature keys can verify tokens. The
+            # algorithm is taken from the JWK itself, since PyJWK only exposes it from PyJWT 2.9.
+            self._jwks_keys = {
+                key["kid"]: (jwt.PyJWK(key), key.get("alg", "RS256"))
+                for key in jwks.get("keys", [])
+                if key.get("use", "sig") == "sig" and key.get("alg", "RS256") in self._SIGNING_ALGORITHMS
+            }
+            self._jwks_fetched_at = time.monotonic()
+
+    def _find_signing_key(self, kid: str) -> Tuple[jwt.PyJWK, str]:
+        """Return the cached signing key for ``kid``, refreshing the JWKS when needed.
+
+        Args:
+            kid (str): Key ID from the token header.
+
+        Returns:
+            Tuple[jwt.PyJWK, str]: The parsed realm key used to sign the token and its algorithm.
+
+        Raises:
+            KeyError: If the key is unknown even after a refresh.
+        """
+        self._refresh_jwks(self.jwks_ttl)
+        if kid not in self._jwks_keys:
+            # Keys may have been rotated since the last fetch
+            self._refresh_jwks(self.JWKS_MIN_REFRESH_INTERVAL, use_shared=False)
+        return self._jwks_keys[kid]
+
+    def _get_realm_public_key(self) -> RSAPublicKey:
+        """Return the parsed realm public key, re-fetching it after ``jwks_ttl``.
+
+        Only used for tokens whose header carries no ``kid``.
+
+        Returns:
+            RSAPublicKey: The realm public key.
+        """
+        with self._jwks_lock:
+            if time.monotonic() - self._realm_key_fetched_at >= self.jwks_ttl:
+                pem = "-----BEGIN PUBLIC KEY-----\n" + self.keycloak_openid.public_key() + "\n-----END PUBLIC KEY-----"
+                self._realm_key = serialization.load_pem_public_key(pem.encode())
+                self._realm_key_fetched_at = time.monotonic()
+            return self._realm_key
 
     def verify_token(self, token: str) -> Dict[str, Any]:
         """Verify a Keycloak JWT token.
@@ -200,14 +477,20 @@ class KeycloakAuthProvider:
             Unauthorized: If the token is invalid or expired.
         """
         try:
-            return self.keycloak_openid.decode_token(
+            kid = _header_kid(token.partition(".")[0])
+            if kid is None:
+                key, algorithms = self._get_realm_public_key(), ["RS256"]
+            else:
+                signing_key, algorithm = self._find_signing_key(kid)
+                key, algorithms = signing_key.key, [algorithm]
+            return jwt.decode(
                 token,
-                key=self.keycloak_openid.public_key(),
-                options={"verify_signature": True, "verify_aud": False},
+                key=key,
+                algorithms=algorithms,
+                options=self._DECODE_OPTIONS,
             )
         except Exception as e:
-            logger.error("Token verification failed", error=str(e))
-            raise Unauthorized("Invalid token")
+            raise Unauthorized("Invalid token") from e
 
     def get_user_info(self, token: str) -> Dict[str, Any]:
         """Get user information from Keycloak.
@@ -224,10 +507,18 @@ class KeycloakAuthProvider:
         try:
             return self.keycloak_openid.userinfo(token)
         except Exception as e:
-            logger.error("Failed to get user info", error=str(e))
+            logger.error("Failed to get user info", error=e)
             raise Unauthorized("Failed to get user info")
 
 
+# Provider classes by the type name accepted in configuration
+_PROVIDERS = {
+    "okta": OktaAuthProvider,
+    "keycloak": KeycloakAuthProvider,
+    "mock": MockAuthProvider,
+}
+
+
 class AuthManager:
     """Manages authentication and authorization.
 
@@ -236,10 +527,16 @@ class AuthManager:
     decorators for protecting routes.
 
     Attributes:
+        TOKEN_CACHE_TTL (int): Default upper bound in seconds for caching verified token claims.
+        LOCAL_TOKEN_CACHE_SIZE (int): Maximum number of tokens kept in the in-process claims cache.
         app (Flask): The Flask application instance.
-        auth_provider (AuthProvider): The active authentication provider.
+        auth_provider (AuthProvider): The active authentication provider, built on first use.
+        token_cache_ttl (int): Configured claims cache TTL; 0 disables claims caching.
     """
 
+    TOKEN_CACHE_TTL = 60
+    LOCAL_TOKEN_CACHE_SIZE = 10_000
+
     def __init__(self, app=None):
         """Initialize the auth manager.
 
@@ -247,25 +544,147 @@ class AuthManager:
             app (Flask, optional): Flask application instance. Defaults to None.
         """
         self.app = app
-        self.auth_provider = None
+        self._provider_type: Optional[str] = None
+        self._auth_provider = None
+        self._auth_provider_lock = threading.Lock()
+        self.token_cache_ttl = self.TOKEN_CACHE_TTL
+        self._local_claims: Optional[TTLCache] = None
+        self._local_claims_lock = threading.Lock()
         if app is not None:
             self.init_app(app)
 
     def init_app(self, app):
         """Initialize the auth manager with the Flask app.
 
+        The provider itself is only built on first use, unless ``AUTH_PREWARM``
+        is set, in which case it is built here and its signing keys fetched.
+
         Args:
             app (Flask): Flask application instance.
         """
         self.app = app
-        provider_type = "mock" if app.config.get("TESTING") else "keycloak"
-        self.auth_provider = AuthProvider.create_provider(provider_type)
+        # A short TTL bounds how long a revoked token keeps being accepted
+        self.token_cache_ttl = int(app.config.get("AUTH_CACHE_TTL", self.TOKEN_CACHE_TTL))
+        self._local_claims = TTLCache(maxsize=self.LOCAL_TOKEN_CACHE_SIZE, ttl=self.token_cache_ttl) if self.token_cache_ttl > 0 else None
+        self._provider_type = "mock" if app.config.get("TESTING") else "keycloak"
+        self._auth_provider = None
+        if str(app.config.get("AUTH_PREWARM", "1")).lower() in ("1", "true", "yes"):
+            try:
+                # Prewarming may go through the shared cache, which needs an app context
+                with app.app_context():
+                    self.auth_provider.prewarm()
+            except Exception as e:
+                # Verification fetches the keys lazily if the provider is unreachable at startup
+                logger.warning("Failed to prefetch signing keys", error=e)
+
+    @property
+    def auth_provider(self):
+        """Return the authentication provider, creating it on first access.
+
+        Returns:
+            AuthProvider: The active authentication provider.
+
+        Raises:
+            RuntimeError: If ``init_app`` has not been called.
+        """
+        if self._auth_provider is None:
+            if self._provider_type is None:
+                raise RuntimeError("AuthManager is not initialized; call init_app first")
+            with self._auth_provider_lock:
+                if self._auth_provider is None:
+                    self._auth_provider = AuthProvider.create_provider(self._provider_type, self.app)
+        return self._auth_provider
+
+    @staticmethod
+    def _token_digest(token: str) -> bytes:
+        """Hash a bearer token so caches never hold the raw token.
+
+        Args:
+            token (str): The raw bearer token.
+
+        Returns:
+            bytes: A 16-byte digest of the token.
+        """
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    @classmethod
+    def _token_cache_key(cls, prefix: str, token: str) -> str:
+        """Build a shared cache key for a bearer token.
+
+        Args:
+            prefix (str): Namespace for the cached value.
+            token (str): The raw bearer token.
+
+        Returns:
+            str: The cache key.
+        """
+        return prefix + cls._token_digest(token).hex()
+
+    def verify_token(self, token: str) -> Dict[str, Any]:
+        """Verify a token, reusing cached claims while the token is valid.
+
+        Claims are looked up in an in-process TTL cache first and then in Redis, so
+        signature verification only runs when neither has the token. Claims are cached
+        for at most ``token_cache_ttl`` seconds and never beyond the token's ``exp``.
+
+        Args:
+            token (str): The JWT token to verify.
+
+        Returns:
+            Dict[str, Any]: The verified token claims.
+
+        Raises:
+            Unauthorized: If the token is invalid or expired.
+        """
+        if self._local_claims is None:
+            return self.auth_provider.verify_token(token)
+
+        digest = self._token_digest(token)
+        with self._local_claims_lock:
+            claims = self._local_claims.get(digest)
+        if claims is not None and claims.get("exp", 0) > time.time():
+            return claims
+
+        key = self._token_cache_key("jwt:", token)
+        claims = _shared_cache_get(key)
+        if claims is None or claims.get("exp", 0) <= time.time():
+            claims = self.auth_provider.verify_token(token)
+            exp = claims.get("exp")
+            if not exp:
+                return claims
+            timeout = min(self.token_cache_ttl, int(exp - time.time()))
+            if timeout <= 0:
+                return claims
+            _shared_cache_set(key, claims, timeout)
+
+        with self._local_claims_lock:
+            self._local_claims[digest] = claims
+        return claims
+
+    def forget_token(self, token: str) -> None:
+        """Drop cached claims for a token, e.g. on logout.
+
+        Args:
+            token (str): The JWT token to forget.
+        """
+        from . import cache
+
+        try:
+            cache.delete(self._token_cache_key("jwt:", token))
+            if self._local_claims is not None:
+                with self._local_claims_lock:
+                    self._local_claims.pop(self._token_digest(token), None)
+        except Exception as e:
+            logger.warning("Auth cache invalidation failed", error=e)
 
     def login_required(self, f):
         """Require authentication for routes.
 
-        This decorator verifies the JWT token in the request header and adds
-        the authenticated user information to Flask's g object.
+        This decorator verifies the JWT token in the request header and stores
+        the claims on the request, where ``current_user`` reads them. The
+        subject is also set as ``g.user_id`` for audit logging. For
+        coroutine views the blocking verification runs in a worker thread so
+        it does not stall the event loop.
 
         Args:
             f (callable): The route function to protect.
@@ -273,29 +692,46 @@ class AuthManager:
         Returns:
             callable: The decorated function.
         """
+        if asyncio.iscoroutinefunction(f):
+
+            @wraps(f)
+            async def async_decorated_function(*args, **kwargs):
+                token = _bearer_token(request.headers.get("Authorization"))
+                claims = await asyncio.to_thread(self._verify_or_reject, token)
+                request.environ[_CLAIMS_ENVIRON_KEY] = claims
+                g.user_id = claims.get("sub")
+                return await f(*args, **kwargs)
+
+            return async_decorated_function
 
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            auth_header = request.headers.get("Authorization")
-            if not auth_header:
-                raise Unauthorized("No authorization header")
+            token = _bearer_token(request.headers.get("Authorization"))
+            claims = self._verify_or_reject(token)
+            request.environ[_CLAIMS_ENVIRON_KEY] = claims
+            g.user_id = claims.get("sub")
+            return f(*args, **kwargs)
 
-            try:
-                token_type, token = auth_header.split()
-                if token_type.lower() != "bearer":
-                    raise Unauthorized("Invalid token type")
-            except ValueError:
-                raise Unauthorized("Invalid authorization header format")
+        return decorated_function
 
-            try:
-                claims = self.auth_provider.verify_token(token)
-                g.user = claims
-                return f(*args, **kwargs)
-            except Exception as e:
-                logger.error("Authentication failed", error=str(e))
-                raise Unauthorized("Invalid token")
+    def _verify_or_reject(self, token: str) -> Dict[str, Any]:
+        """Verify a token, mapping any failure to ``Unauthorized``.
 
-        return decorated_function
+        Args:
+            token (str): The JWT token to verify.
+
+        Returns:
+            Dict[str, Any]: The verified token claims.
+
+        Raises:
+            Unauthorized: If the token cannot be verified.
+        """
+        try:
+            return self.verify_token(token)
+        except Exception as e:
+            # Providers raise Unauthorized from the underlying error; log the cause once here
+            logger.error("Authentication failed", error=e.__cause__ or e)
+            raise Unauthorized("Invalid token") from e
 
     def get_user_info(self) -> Optional[Dict[str, Any]]:
         """Get information about the current user.
@@ -303,8 +739,28 @@ class AuthManager:
         Returns:
             Optional[Dict[str, Any]]: User information if authenticated, None otherwise.
         """
-        return getattr(g, "user", None)
+        return request.environ.get(_CLAIMS_ENVIRON_KEY)
 
 
 # Global instance
 auth_manager = AuthManager()
+
+
+def _resolve_user() -> Optional[Dict[str, Any]]:
+    """Return the verified claims for the current request.
+
+    Claims stored by ``login_required`` are returned directly. On routes without it,
+    a bearer token is only verified when ``current_user`` is first read.
+
+    Returns:
+        Optional[Dict[str, Any]]: The token claims, or None if no token was sent.
+    """
+    environ = request.environ
+    if _CLAIMS_ENVIRON_KEY not in environ:
+        auth_header = request.headers.get("Authorization")
+        environ[_CLAIMS_ENVIRON_KEY] = auth_manager.verify_token(_bearer_token(auth_header)) if auth_header else None
+    return environ[_CLAIMS_ENVIRON_KEY]
+
+
+# Claims of the authenticated user for the current request
+current_user = LocalProxy(_resolve_user)
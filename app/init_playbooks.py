@@ -6,17 +6,23 @@ and verifying playbook configurations. It supports both default playbooks
 and custom configurations through environment variables.
 """
 
-import json
 import logging
 import os
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, wraps
 from pathlib import Path
 from typing import Any, Dict, List
 
-import ansible_runner
-import git
+import orjson
 import yaml
-from tenacity import retry, stop_after_attempt, wait_exponential
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -44,6 +50,35 @@ DEFAULT_PLAYBOOKS = {
 }
 
 
+def _lazy_retry(attempts: int, wait_min: float, wait_max: float):
+    """Retry the decorated function with exponential backoff, importing tenacity on first call.
+
+    Args:
+        attempts (int): Maximum number of attempts.
+        wait_min (float): Minimum wait between attempts in seconds.
+        wait_max (float): Maximum wait between attempts in seconds.
+
+    Returns:
+        callable: The decorator.
+    """
+
+    def decorator(func):
+        retrying = None
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal retrying
+            if retrying is None:
+                from tenacity import retry, stop_after_attempt, wait_exponential
+
+                retrying = retry(stop=stop_after_attempt(attempts), wait=wait_exponential(multiplier=1, min=wait_min, max=wait_max))(func)
+            return retrying(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 class PlaybookConfig:
     """Configuration wrapper for individual Ansible playbooks.
 
@@ -58,6 +93,8 @@ class PlaybookConfig:
         variables (list): Required variables for playbook execution.
     """
 
+    __slots__ = ("name", "filename", "required", "description", "variables")
+
     def __init__(self, name: str, config: Dict[str, Any]):
         """Initialize a playbook configuration.
 
@@ -69,7 +106,8 @@ class PlaybookConfig:
         self.filename = config.get("name", f"{name}.yml")
         self.required = config.get("required", False)
         self.description = config.get("description", "")
-        self.variables = config.get("variables", [])
+        # Copied so callers can modify the list without touching the source configuration
+        self.variables = list(config.get("variables", []))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the configuration to a dictionary.
@@ -85,6 +123,52 @@ class PlaybookConfig:
         }
 
 
+def _build_default_repo_files() -> Dict[str, str]:
+    """Render the scaffolding files written by ``AnsibleInitializer.create_default_repo``.
+
+    Returns:
+        Dict[str, str]: YAML text keyed by path relative to the playbooks directory.
+    """
+    content = {}
+
+    # Default playbooks
+    for _name, config in DEFAULT_PLAYBOOKS.items():
+        content[config["name"]] = [
+            {
+                "name": config["description"],
+                "hosts": "localhost",
+                "gather_facts": False,
+                "vars": {var: "{{ " + var + " }}" for var in config["variables"]},
+                "tasks": [
+                    {
+                        "name": "Placeholder task",
+                        "debug": {"msg": ("Placeholder playbook - " "replace with actual tasks")},
+                    }
+                ],
+            }
+        ]
+
+    # Requirements files and inventory
+    content["collections/requirements.yml"] = {"collections": []}
+    content["roles/requirements.yml"] = {"roles": []}
+    content["inventory/hosts.yml"] = {
+        "all": {
+            "children": {
+                "k8s_clusters": {
+                    "hosts": {},
+                    "vars": {"ansible_connection": "local"},
+                }
+            }
+        }
+    }
+
+    return {relpath: yaml.dump(data, Dumper=SafeDumper) for relpath, data in content.items()}
+
+
+# The scaffolding is static, so it is serialized once at import
+_DEFAULT_REPO_FILES = _build_default_repo_files()
+
+
 class AnsibleInitializer:
     """Handles initialization and management of Ansible playbooks.
 
@@ -93,15 +177,20 @@ class AnsibleInitializer:
     both default playbooks and custom configurations through environment variables.
 
     Attributes:
+        SYNTAX_CHECK_TIMEOUT (int): Seconds allowed for each playbook syntax check.
         playbooks_dir (str): Directory where playbooks are stored.
         gitea_url (str): Base URL for the Gitea server.
         gitea_token (str): Authentication token for Gitea.
         repo_name (str): Name of the playbooks repository.
         collections_path (str): Path to Ansible collections.
         roles_path (str): Path to Ansible roles.
+        config_path (str): Path to the ``playbooks.yml`` configuration file.
+        requirements_paths (Dict[str, str]): Galaxy requirements files keyed by ``collections``/``roles``.
         playbooks (Dict[str, PlaybookConfig]): Loaded playbook configurations.
     """
 
+    SYNTAX_CHECK_TIMEOUT = 30
+
     def __init__(self):
         """Initialize the Ansible environment setup."""
         self.playbooks_dir = os.environ.get("PLAYBOOKS_DIR", "/app/playbooks")
@@ -112,6 +201,11 @@ class AnsibleInitializer:
         # Create necessary directories
         self.collections_path = os.path.join(self.playbooks_dir, "collections")
         self.roles_path = os.path.join(self.playbooks_dir, "roles")
+        self.config_path = os.path.join(self.playbooks_dir, "playbooks.yml")
+        self.requirements_paths = {
+            "collections": os.path.join(self.collections_path, "requirements.yml"),
+            "roles": os.path.join(self.roles_path, "requirements.yml"),
+        }
         Path(self.collections_path).mkdir(parents=True, exist_ok=True)
         Path(self.roles_path).mkdir(parents=True, exist_ok=True)
 
@@ -134,36 +228,32 @@ class AnsibleInitializer:
         playbooks_json = os.environ.get("ANSIBLE_PLAYBOOKS")
         if playbooks_json:
             try:
-                config = json.loads(playbooks_json)
+                config = orjson.loads(playbooks_json)
                 for _name, pb_config in config.items():
                     playbooks[_name] = PlaybookConfig(_name, pb_config)
                 logger.info("Loaded playbook configuration from environment")
                 return playbooks
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse ANSIBLE_PLAYBOOKS environment variable: {e}")
+            except orjson.JSONDecodeError as e:
+                logger.warning("Failed to parse ANSIBLE_PLAYBOOKS environment variable: %s", e)
 
         # Try loading from config file
-        config_path = os.path.join(self.playbooks_dir, "playbooks.yml")
-        if os.path.exists(config_path):
+        if os.path.exists(self.config_path):
             try:
-                with open(config_path) as f:
-                    config = yaml.safe_load(f)
+                config = self._load_yaml(self.config_path)
                 for _name, pb_config in config.items():
                     playbooks[_name] = PlaybookConfig(_name, pb_config)
                 logger.info("Loaded playbook configuration from playbooks.yml")
                 return playbooks
             except Exception as e:
-                logger.warning(f"Failed to load playbooks.yml: {e}")
+                logger.warning("Failed to load playbooks.yml: %s", e)
 
         # Fall back to default configuration
         logger.info("Using default playbook configuration")
-        for _name, config in DEFAULT_PLAYBOOKS.items():
-            playbooks[_name] = PlaybookConfig(_name, config)
+        return {_name: PlaybookConfig(_name, config) for _name, config in DEFAULT_PLAYBOOKS.items()}
 
-        return playbooks
-
-    def get_repo_url(self) -> str:
-        """Get repository URL with authentication if token is provided.
+    @cached_property
+    def repo_url(self) -> str:
+        """Repository URL with authentication if a token is provided, computed once.
 
         Returns:
             str: Repository URL.
@@ -176,7 +266,7 @@ class AnsibleInitializer:
             return base_url
         return base_url
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    @_lazy_retry(attempts=3, wait_min=4, wait_max=10)
     def clone_or_pull_repo(self) -> None:
         """Clone or pull the playbooks repository.
 
@@ -188,29 +278,65 @@ class AnsibleInitializer:
             Exception: If the repository operation fails.
         """
         try:
-            repo_url = self.get_repo_url()
-
             if os.path.exists(os.path.join(self.playbooks_dir, ".git")):
                 logger.info("Repository exists, pulling latest changes...")
-                repo = git.Repo(self.playbooks_dir)
-                origin = repo.remotes.origin
-                origin.pull()
+                self._git_shallow("-C", self.playbooks_dir, "fetch", "--no-tags", "--depth=1", "origin")
+                local = self._git("-C", self.playbooks_dir, "rev-parse", "HEAD")
+                remote = self._git("-C", self.playbooks_dir, "rev-parse", "FETCH_HEAD")
+                if local == remote:
+                    logger.info("Repository already up to date")
+                    return
+                self._git("-C", self.playbooks_dir, "reset", "--hard", remote)
             else:
                 logger.info("Cloning repository...")
-                git.Repo.clone_from(repo_url, self.playbooks_dir)
+                self._git_shallow("clone", "--depth=1", "--single-branch", "--no-tags", self.repo_url, self.playbooks_dir)
 
             logger.info("Repository sync completed successfully")
-        except git.GitCommandError as e:
-            if "Repository not found" in str(e):
+        except subprocess.CalledProcessError as e:
+            if "Repository not found" in (e.stderr or ""):
                 logger.info("Repository doesn't exist, creating default structure...")
                 self.create_default_repo()
             else:
-                logger.error(f"Git operation failed: {str(e)}")
+                logger.error("Git operation failed: %s", e.stderr)
                 raise
         except Exception as e:
-            logger.error(f"Failed to sync repository: {str(e)}")
+            logger.error("Failed to sync repository: %s", e)
             raise
 
+    @classmethod
+    def _git_shallow(cls, *args: str) -> None:
+        """Run a shallow ``git`` command, retrying without ``--depth`` if the remote refuses it.
+
+        Args:
+            *args (str): Arguments passed to ``git``, including ``--depth=1``.
+
+        Raises:
+            subprocess.CalledProcessError: If the command fails for another reason.
+        """
+        try:
+            cls._git(*args)
+        except subprocess.CalledProcessError as e:
+            # Dumb HTTP remotes and some servers cannot serve shallow packs
+            if "shallow" not in (e.stderr or ""):
+                raise
+            logger.warning("Remote does not support shallow fetches, fetching full history")
+            cls._git(*(arg for arg in args if arg != "--depth=1"))
+
+    @staticmethod
+    def _git(*args: str) -> str:
+        """Run a ``git`` command, capturing its output.
+
+        Args:
+            *args (str): Arguments passed to ``git``.
+
+        Returns:
+            str: The command's standard output, stripped.
+
+        Raises:
+            subprocess.CalledProcessError: If the command exits non-zero.
+        """
+        return subprocess.run(["git", *args], check=True, capture_output=True, text=True).stdout.strip()
+
     def create_default_repo(self) -> None:
         """Create default repository structure with essential playbooks.
 
@@ -221,211 +347,219 @@ class AnsibleInitializer:
             Exception: If the repository creation fails.
         """
         try:
+            import git
+
             # Create local repository
             repo = git.Repo.init(self.playbooks_dir)
 
-            # Create default playbooks
-            for _name, config in DEFAULT_PLAYBOOKS.items():
-                playbook_path = os.path.join(self.playbooks_dir, config["name"])
-                with open(playbook_path, "w") as f:
-                    yaml.safe_dump(
-                        [
-                            {
-                                "name": config["description"],
-                                "hosts": "localhost",
-                                "gather_facts": False,
-                                "vars": {var: "{{ " + var + " }}" for var in config["variables"]},
-                                "tasks": [
-                                    {
-                                        "name": "Placeholder task",
-                                        "debug": {"msg": ("Placeholder playbook - " "replace with actual tasks")},
-                                    }
-                                ],
-                            }
-                        ],
-                        f,
-                    )
-
-            # Create requirements files
-            collections_path = os.path.join(self.playbooks_dir, "collections/requirements.yml")
-            roles_path = os.path.join(self.playbooks_dir, "roles/requirements.yml")
-
-            Path(collections_path).parent.mkdir(parents=True, exist_ok=True)
-            Path(roles_path).parent.mkdir(parents=True, exist_ok=True)
-
-            with open(collections_path, "w") as f:
-                yaml.safe_dump({"collections": []}, f)
-
-            with open(roles_path, "w") as f:
-                yaml.safe_dump({"roles": []}, f)
-
-            # Create inventory
-            inventory_path = os.path.join(self.playbooks_dir, "inventory/hosts.yml")
-            Path(inventory_path).parent.mkdir(parents=True, exist_ok=True)
-            with open(inventory_path, "w") as f:
-                yaml.safe_dump(
-                    {
-                        "all": {
-                            "children": {
-                                "k8s_clusters": {
-                                    "hosts": {},
-                                    "vars": {"ansible_connection": "local"},
-                                }
-                            }
-                        }
-                    },
-                    f,
-                )
+            root = Path(self.playbooks_dir)
+            for parent in {(root / relpath).parent for relpath in _DEFAULT_REPO_FILES}:
+                parent.mkdir(parents=True, exist_ok=True)
+            for relpath, text in _DEFAULT_REPO_FILES.items():
+                (root / relpath).write_text(text)
 
             # Commit and push if we have credentials
-            repo.index.add("*")
+            repo.index.add(list(_DEFAULT_REPO_FILES))
             repo.index.commit("Initial commit with default playbooks")
 
             if self.gitea_token:
-                repo.create_remote("origin", self.get_repo_url())
+                repo.create_remote("origin", self.repo_url)
                 repo.remotes.origin.push("master")
                 logger.info("Created and pushed default repository structure")
             else:
                 logger.warning("No Gitea token provided, skipping repository push")
 
         except Exception as e:
-            logger.error(f"Failed to create default repository: {str(e)}")
+            logger.error("Failed to create default repository: %s", e)
             raise
 
+    @staticmethod
+    def _load_yaml(path: str) -> Any:
+        """Parse a YAML file, skipping the YAML parser for documents written as JSON.
+
+        Args:
+            path (str): Path to the YAML file.
+
+        Returns:
+            Any: The parsed document.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            yaml.YAMLError: If the file is not valid YAML.
+        """
+        raw = Path(path).read_bytes()
+        # JSON is valid YAML; documents written as JSON can skip the YAML parser entirely
+        if raw.lstrip()[:1] in (b"{", b"["):
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+        return yaml.load(raw, Loader=SafeLoader)
+
+    def _read_requirements_file(self, path: str, key: str) -> List[Any]:
+        """Read one Galaxy requirements file.
+
+        Args:
+            path (str): Path to the requirements file.
+            key (str): Top-level key holding the requirement list (``collections`` or ``roles``).
+
+        Returns:
+            List[Any]: The requirement entries, or an empty list if the file is missing or invalid.
+        """
+        try:
+            data = self._load_yaml(path)
+        except FileNotFoundError:
+            return []
+        except yaml.YAMLError as e:
+            logger.error("Error parsing %s requirements: %s", key, e)
+            return []
+
+        if isinstance(data, dict) and key in data:
+            return data[key]
+        if isinstance(data, list):
+            return data
+        return []
+
     def read_requirements(self) -> Dict[str, List[str]]:
         """Read requirements files for collections and roles.
 
+        Both files are read concurrently so their disk I/O overlaps.
+
         Returns:
             Dict[str, List[str]]: Dictionary of requirements for collections and roles.
         """
-        requirements = {"collections": [], "roles": []}
-
-        # Read collections requirements
-        collections_req = os.path.join(self.playbooks_dir, "collections/requirements.yml")
-        if os.path.exists(collections_req):
-            with open(collections_req) as f:
-                try:
-                    data = yaml.safe_load(f)
-                    if isinstance(data, dict) and "collections" in data:
-                        requirements["collections"] = data["collections"]
-                    elif isinstance(data, list):
-                        requirements["collections"] = data
-                except yaml.YAMLError as e:
-                    logger.error(f"Error parsing collections requirements: {str(e)}")
-
-        # Read roles requirements
-        roles_req = os.path.join(self.playbooks_dir, "roles/requirements.yml")
-        if os.path.exists(roles_req):
-            with open(roles_req) as f:
-                try:
-                    data = yaml.safe_load(f)
-                    if isinstance(data, dict) and "roles" in data:
-                        requirements["roles"] = data["roles"]
-                    elif isinstance(data, list):
-                        requirements["roles"] = data
-                except yaml.YAMLError as e:
-                    logger.error(f"Error parsing roles requirements: {str(e)}")
-
-        return requirements
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                key: executor.submit(self._read_requirements_file, self.requirements_paths[key], key)
+                for key in ("collections", "roles")
+            }
+        return {key: future.result() for key, future in futures.items()}
+
+    def _galaxy_install_args(self, kind: str, path: str, items: List[Any], tmp_dir: str) -> List[str]:
+        """Build the ``ansible-galaxy`` install command for one requirement type.
+
+        The entries are written to a requirements file in ``tmp_dir`` so that a single
+        ``ansible-galaxy`` run resolves them all without a long argument list, whether
+        they were read from the repository or supplied by the caller.
+
+        Args:
+            kind (str): Either ``collection`` or ``role``.
+            path (str): Install destination passed to ``-p``.
+            items (List[Any]): Requirement entries, as names or dicts with ``name``/``version``.
+            tmp_dir (str): Directory for generated requirements files.
+
+        Returns:
+            List[str]: The command line to run.
+        """
+        requirements_file = os.path.join(tmp_dir, f"{kind}s.yml")
+        Path(requirements_file).write_text(yaml.dump({f"{kind}s": items}, Dumper=SafeDumper))
+
+        return ["ansible-galaxy", kind, "install", "-f", "-p", path, "-r", requirements_file]
 
     def install_galaxy_requirements(self, requirements: Dict[str, List[str]]) -> None:
         """Install Ansible Galaxy requirements.
 
+        Collections and roles are independent downloads, so both installs run concurrently.
+
         Args:
             requirements (Dict[str, List[str]]): Dictionary of requirements for
                 collections and roles.
         """
-        try:
-            # Install collections
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            commands = []
             if requirements["collections"]:
                 logger.info("Installing Ansible collections...")
-                collection_args = [
-                    "ansible-galaxy",
-                    "collection",
-                    "install",
-                    "-f",
-                    "-p",
-                    self.collections_path,
-                ]
-
-                for collection in requirements["collections"]:
-                    if isinstance(collection, dict):
-                        collection_name = collection.get("name")
-                        collection_version = collection.get("version", "*")
-                        if collection_name:
-                            collection_args.append(f"{collection_name}:{collection_version}")
-                    else:
-                        collection_args.append(collection)
-
-                subprocess.run(collection_args, check=True)
-
-            # Install roles
+                commands.append(self._galaxy_install_args("collection", self.collections_path, requirements["collections"], tmp_dir))
             if requirements["roles"]:
                 logger.info("Installing Ansible roles...")
-                role_args = [
-                    "ansible-galaxy",
-                    "role",
-                    "install",
-                    "-f",
-                    "-p",
-                    self.roles_path,
-                ]
-
-                for role in requirements["roles"]:
-                    if isinstance(role, dict):
-                        role_name = role.get("name")
-                        role_version = role.get("version", "*")
-                        if role_name:
-                            role_args.append(f"{role_name}:{role_version}")
-                    else:
-                        role_args.append(role)
-
-                subprocess.run(role_args, check=True)
+                commands.append(self._galaxy_install_args("role", self.roles_path, requirements["roles"], tmp_dir))
 
+            if not commands:
+                return
+
+            try:
+                with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+                    futures = [executor.submit(subprocess.run, args, check=True) for args in commands]
+                    for future in futures:
+                        future.result()
+            except subprocess.CalledProcessError as e:
+                logger.error("Failed to install Galaxy requirements: %s", e)
+                raise
+
+    def _check_playbook_syntax(self, playbook: PlaybookConfig) -> None:
+        """Parse a playbook with ``ansible-playbook --syntax-check`` without running any tasks.
+
+        Args:
+            playbook (PlaybookConfig): The playbook to check.
+
+        Raises:
+            subprocess.CalledProcessError: If the playbook fails to parse.
+        """
+        playbook_path = os.path.join(self.playbooks_dir, playbook.filename)
+        try:
+            subprocess.run(
+                ["ansible-playbook", "--syntax-check", playbook_path],
+                check=True,
+                capture_output=True,
+                timeout=self.SYNTAX_CHECK_TIMEOUT,
+            )
+            logger.info("Validated playbook: %s", playbook.filename)
         except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to install Galaxy requirements: {str(e)}")
+            logger.error("Failed to validate playbook %s: %s", playbook.filename, e.stderr.decode(errors="replace"))
+            raise
+        except Exception as e:
+            logger.error("Failed to validate playbook %s: %s", playbook.filename, e)
             raise
 
     def verify_playbooks(self) -> None:
         """Verify required playbooks exist and are valid.
 
+        Syntax checks of the required playbooks run in parallel, and every failure is
+        reported rather than only the first.
+
         Raises:
             FileNotFoundError: If required playbooks are missing.
+            RuntimeError: If any required playbook fails its syntax check.
         """
         missing_required = []
+        to_check = []
 
         for _name, playbook in self.playbooks.items():
             if not playbook.required:
                 continue
 
-            playbook_path = os.path.join(self.playbooks_dir, playbook.filename)
-            if not os.path.exists(playbook_path):
+            if not os.path.exists(os.path.join(self.playbooks_dir, playbook.filename)):
                 missing_required.append(playbook.filename)
-                continue
-
-            try:
-                # Validate playbook syntax
-                runner = ansible_runner.Runner(
-                    playbook=playbook_path,
-                    private_data_dir=os.environ.get("RUNNER_PATH", "/runner"),
-                    quiet=True,
-                )
-                runner.run()
-                logger.info(f"Validated playbook: {playbook.filename}")
-            except Exception as e:
-                logger.error(f"Failed to validate playbook {playbook.filename}: {str(e)}")
-                raise
+            else:
+                to_check.append(playbook)
 
         if missing_required:
             raise FileNotFoundError(f"Required playbooks not found: {', '.join(missing_required)}")
 
+        if not to_check:
+            return
+
+        invalid = []
+        with ThreadPoolExecutor(max_workers=min(len(to_check), os.cpu_count() or 1)) as executor:
+            futures = {playbook.filename: executor.submit(self._check_playbook_syntax, playbook) for playbook in to_check}
+        for filename, future in futures.items():
+            if future.exception() is not None:
+                invalid.append(filename)
+
+        if invalid:
+            raise RuntimeError(f"Playbook syntax check failed: {', '.join(invalid)}")
+
     def save_playbook_config(self) -> None:
-        """Save current playbook configuration to file."""
+        """Save current playbook configuration to file.
+
+        The file is written to a temporary sibling and renamed into place, so a crash
+        mid-write never leaves a truncated ``playbooks.yml`` behind.
+        """
         config = {_name: playbook.to_dict() for _name, playbook in self.playbooks.items()}
 
-        config_path = os.path.join(self.playbooks_dir, "playbooks.yml")
-        with open(config_path, "w") as f:
-            yaml.safe_dump(config, f)
+        tmp_path = Path(f"{self.config_path}.tmp")
+        tmp_path.write_bytes(yaml.dump(config, Dumper=SafeDumper).encode())
+        os.replace(tmp_path, self.config_path)
         logger.info("Saved playbook configuration to playbooks.yml")
 
     def initialize(self) -> bool:
@@ -448,13 +582,13 @@ class AnsibleInitializer:
             self.verify_playbooks()
 
             # Save configuration if it was loaded from defaults
-            if not os.path.exists(os.path.join(self.playbooks_dir, "playbooks.yml")):
+            if not os.path.exists(self.config_path):
                 self.save_playbook_config()
 
             logger.info("Ansible initialization completed successfully")
             return True
         except Exception as e:
-            logger.error(f"Ansible initialization failed: {str(e)}")
+            logger.error("Ansible initialization failed: %s", e)
             raise
 
 
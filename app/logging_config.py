@@ -16,16 +16,21 @@ Environment Variables:
 
 import logging
 import os
+from functools import lru_cache, partial
 from typing import Dict
 
+import orjson
 import structlog
 
 
+@lru_cache(maxsize=1)
 def get_k8s_context() -> Dict[str, str]:
     """Gather Kubernetes-specific context for logging.
 
     Retrieves environment variables typically available in a Kubernetes pod
-    for enhanced logging context in containerized environments.
+    for enhanced logging context in containerized environments. These do not
+    change for the life of a pod, so the result is computed once and shared;
+    callers must not mutate it.
 
     Returns:
         Dict[str, str]: Dictionary containing Kubernetes-specific context
@@ -38,6 +43,22 @@ def get_k8s_context() -> Dict[str, str]:
     }
 
 
+def _add_static_context(logger, method_name: str, event_dict: Dict, context: Dict[str, str]) -> Dict:
+    """Merge fixed process-level fields into a log entry.
+
+    Args:
+        logger: The wrapped logger (unused).
+        method_name (str): Name of the log method called (unused).
+        event_dict (Dict): The event being processed.
+        context (Dict[str, str]): Fields to add to every entry.
+
+    Returns:
+        Dict: The updated event dictionary.
+    """
+    event_dict.update(context)
+    return event_dict
+
+
 def configure_logging(
     app_name: str = "pxbackup-ansible-runner",
 ) -> structlog.BoundLogger:
@@ -69,23 +90,15 @@ def configure_logging(
     log_level = os.getenv("LOG_LEVEL", "INFO")
     log_level_num = getattr(logging, log_level.upper(), logging.INFO)
 
-    # Get Kubernetes context
-    k8s_context = get_k8s_context()
-
     # Configure structlog
     base_processors = [
         structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
         # Add Kubernetes context to all log entries
-        lambda logger, method_name, event_dict: {
-            **event_dict,
-            **k8s_context,
-            "app_name": app_name,
-        },
+        partial(_add_static_context, context={**get_k8s_context(), "app_name": app_name}),
     ]
 
     # Configure based on environment
@@ -95,32 +108,20 @@ def configure_logging(
         processors = base_processors + [
             structlog.dev.ConsoleRenderer(),
         ]
+        logger_factory = structlog.PrintLoggerFactory()
     else:
+        # orjson renders straight to bytes, which are written to stdout without re-encoding
         processors = base_processors + [
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=orjson.dumps),
         ]
+        logger_factory = structlog.BytesLoggerFactory()
 
     structlog.configure(
         processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(log_level_num),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
-    # Create a shared logger instance
-    logger = structlog.get_logger(app_name)
-
-    # Add environment-specific configuration
-    env = os.getenv("FLASK_ENV", "development")
-    if env == "development":
-        # More verbose logging in development with human-readable format
-        structlog.configure(
-            processors=[
-                structlog.processors.add_log_level,
-                structlog.processors.TimeStamper(fmt="iso"),
-                structlog.dev.ConsoleRenderer(),
-            ]
-        )
-
-    return logger
+    return structlog.get_logger(app_name)
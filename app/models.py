@@ -5,19 +5,7 @@ for the application. It includes models for audit logging, cluster management,
 and playbook execution tracking.
 """
 
-from datetime import datetime, timezone
-
 from . import db
-from .schemas import PlaybookExecutionResponse
-
-
-def get_utc_now():
-    """Get the current UTC time with timezone information.
-
-    Returns:
-        datetime: Current UTC datetime with timezone information.
-    """
-    return datetime.now(timezone.utc)
 
 
 class AuditLog(db.Model):
@@ -34,15 +22,19 @@ class AuditLog(db.Model):
         details (str): Additional details about the action.
         status (str): Current status of the audited action.
         cluster_id (int): Foreign key to the related cluster.
+        cluster (Cluster): The related cluster, if any.
     """
 
     id = db.Column(db.Integer, primary_key=True)
-    timestamp = db.Column(db.DateTime(timezone=True), nullable=False, default=get_utc_now)
-    user_id = db.Column(db.String(255), nullable=False)
+    # log_request supplies the request time; the server default only covers inserts that omit it
+    timestamp = db.Column(db.DateTime(timezone=True), nullable=False, server_default=db.func.now())
+    user_id = db.Column(db.String(255), nullable=False, index=True)
     action = db.Column(db.String(255), nullable=False)
     details = db.Column(db.Text)
-    status = db.Column(db.String(50))
-    cluster_id = db.Column(db.Integer, db.ForeignKey("cluster.id"), nullable=True)
+    status = db.Column(db.String(50), index=True)
+    cluster_id = db.Column(db.Integer, db.ForeignKey("cluster.id", ondelete="CASCADE"), nullable=True, index=True)
+
+    cluster = db.relationship("Cluster", back_populates="audit_logs")
 
 
 class Cluster(db.Model):
@@ -72,18 +64,26 @@ class Cluster(db.Model):
     kubeconfig_vault_path = db.Column(db.String(255), nullable=True)
     service_account = db.Column(db.String(255), nullable=False)
     namespace = db.Column(db.String(255), nullable=False)
-    status = db.Column(db.String(50), nullable=False, default="pending")
-    created_at = db.Column(db.DateTime(timezone=True), nullable=False, default=get_utc_now)
+    status = db.Column(db.String(50), nullable=False, default="pending", index=True)
+    created_at = db.Column(db.DateTime(timezone=True), nullable=False, server_default=db.func.now())
     updated_at = db.Column(
         db.DateTime(timezone=True),
         nullable=False,
-        default=get_utc_now,
-        onupdate=get_utc_now,
+        server_default=db.func.now(),
+        onupdate=db.func.now(),
+    )
+
+    # Relationships. Audit logs can grow without bound, so loading them implicitly raises
+    # instead of silently issuing a query per cluster; query AuditLog directly instead.
+    # Deleting a cluster cascades in the database (ON DELETE CASCADE), so the ORM does not
+    # load the collections just to delete them.
+    playbook_executions = db.relationship(
+        "PlaybookExecution", back_populates="cluster", lazy="selectin", cascade="all, delete-orphan", passive_deletes=True
     )
+    audit_logs = db.relationship("AuditLog", back_populates="cluster", lazy="raise", cascade="all, delete-orphan", passive_deletes=True)
 
-    # Relationships
-    playbook_executions = db.relationship("PlaybookExecution", backref="cluster", lazy=True, cascade="all, delete-orphan")
-    audit_logs = db.relationship("AuditLog", backref="cluster", lazy=True, cascade="all, delete-orphan")
+    # Timestamps are set by the database; fetch them with RETURNING as part of the INSERT/UPDATE
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class PlaybookExecution(db.Model):
@@ -99,29 +99,42 @@ class PlaybookExecution(db.Model):
         started_at (datetime): When the execution began.
         completed_at (datetime): When the execution finished.
         result (str): Result of the execution.
+        extra_vars (str): JSON-encoded variables passed to the playbook.
+        command (str): The ansible-playbook command line that was run.
+        pid (int): Process ID of the playbook run.
+        return_code (int): Exit code of the playbook run once it has finished.
         cluster_id (int): Foreign key to the related cluster.
+        cluster (Cluster): The related cluster.
     """
 
     id = db.Column(db.Integer, primary_key=True)
     playbook_name = db.Column(db.String(255), nullable=False)
-    status = db.Column(db.String(50), nullable=False)
-    started_at = db.Column(db.DateTime(timezone=True), nullable=False, default=get_utc_now)
+    status = db.Column(db.String(50), nullable=False, index=True)
+    started_at = db.Column(db.DateTime(timezone=True), nullable=False, server_default=db.func.now())
     completed_at = db.Column(db.DateTime(timezone=True))
     result = db.Column(db.Text)
-    cluster_id = db.Column(db.Integer, db.ForeignKey("cluster.id"), nullable=False)
-
-    def to_dict(self) -> dict:
-        """Convert playbook execution to dictionary format.
-
-        Returns:
-            dict: Dictionary representation of the playbook execution.
-        """
-        return PlaybookExecutionResponse(
-            id=self.id,
-            playbook_name=self.playbook_name,
-            status=self.status,
-            started_at=self.started_at.isoformat() if self.started_at else None,
-            completed_at=self.completed_at.isoformat() if self.completed_at else None,
-            result=self.result,
-            cluster_id=self.cluster_id,
-        ).dict()
+    extra_vars = db.Column(db.Text)
+    command = db.Column(db.Text)
+    pid = db.Column(db.Integer)
+    return_code = db.Column(db.Integer)
+    cluster_id = db.Column(db.Integer, db.ForeignKey("cluster.id", ondelete="CASCADE"), nullable=False)
+
+    cluster = db.relationship("Cluster", back_populates="playbook_executions")
+
+    # Fetch the server-generated started_at with RETURNING as part of the INSERT
+    __mapper_args__ = {"eager_defaults": True}
+
+
+# Serves "latest executions for a cluster" lookups; also covers filtering on cluster_id alone.
+# On PostgreSQL, INCLUDE (status) lets status checks be answered from the index alone.
+db.Index(
+    "ix_playbook_execution_cluster_started",
+    PlaybookExecution.cluster_id,
+    PlaybookExecution.started_at.desc(),
+    postgresql_include=["status"],
+)
+
+# Both timestamps grow with insertion order, so BRIN indexes serve time-range scans at a
+# fraction of a B-tree's size on PostgreSQL; other databases get a regular index.
+db.Index("ix_audit_log_timestamp_brin", AuditLog.timestamp, postgresql_using="brin")
+db.Index("ix_playbook_execution_started_brin", PlaybookExecution.started_at, postgresql_using="brin")
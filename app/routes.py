@@ -6,40 +6,56 @@ import os
 import shlex
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any, Callable, Dict, Tuple
 
-import aiohttp
+import requests
 from config import Config
 from flask import Blueprint, current_app, g, jsonify, request
-from sqlalchemy import text
+from sqlalchemy import and_, delete, func, select, text
+from sqlalchemy.orm import aliased, raiseload
 
-from app import auth_manager, cache, db, limiter
-from app.models import AuditLog, Cluster, PlaybookExecution
+from app import auth_manager, cache, db, limiter, redis_client
+from app.models import Cluster, PlaybookExecution
 from app.schemas import ClusterStatusResponse, CreateClusterRequest, UpdateServiceAccountRequest
+from app.utils.audit_writer import audit_writer
 from app.utils.exceptions import ExternalServiceError, ResourceAlreadyExistsError, ResourceNotFoundError, ValidationError
+from app.utils.http_client import http_get
+from app.utils.local_cache import ttl_memoize
 from app.utils.monitoring import record_vault_operation, track_request_metrics
+from app.utils.redis_lock import RedisLock
 from app.utils.vault_client import vault_client
 
 bp = Blueprint("api", __name__)
 
-# Initialize rate limiter
-limiter.init_app(current_app)
+HEALTH_CHECK_TIMEOUT = 5.0
+
+# Playbook variables that carry credentials and must never appear in status responses
+_SECRET_EXTRA_VARS = frozenset({"kubeconfig_base64"})
+
+# Threads that fork/exec playbook processes, keeping the spawn off the event loop
+_PLAYBOOK_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="playbook-spawn")
 
 
 async def log_request(user_id: str, action: str, details: str, status: str):
     """Log an API request asynchronously.
 
+    The entry is handed to the background audit writer, which inserts queued entries
+    from all requests in batches, so the request itself never waits on a commit.
+
     Args:
         user_id: The ID of the user making the request.
         action: The action being performed.
         details: Additional details about the request.
         status: The status of the request.
     """
-    log = AuditLog(user_id=user_id, action=action, details=details, status=status, timestamp=datetime.now(timezone.utc))
-    db.session.add(log)
-    await db.session.commit()
+    # Stamp the time here; the row is written a moment later with others in its batch
+    audit_writer.put(
+        {"user_id": user_id, "action": action, "details": details, "status": status, "timestamp": datetime.now(timezone.utc)}
+    )
 
 
 async def _check_service_health(name: str, check_func: Callable) -> Dict[str, Any]:
@@ -54,45 +70,51 @@ async def _check_service_health(name: str, check_func: Callable) -> Dict[str, An
     """
     try:
         start_time = time.time()
-        await check_func()
+        await asyncio.wait_for(check_func(), timeout=HEALTH_CHECK_TIMEOUT)
         return {
             "status": "healthy",
             "latency_ms": round((time.time() - start_time) * 1000, 2),
         }
+    except asyncio.TimeoutError:
+        return {"status": "unhealthy", "error": f"{name} check timed out after {HEALTH_CHECK_TIMEOUT}s"}
     except Exception as e:
         return {"status": "unhealthy", "error": str(e)}
 
 
+def _ping_database() -> None:
+    """Run a trivial query on a pooled connection, bounded to one second on PostgreSQL.
+
+    This is blocking; call it through ``asyncio.to_thread``.
+    """
+    with db.engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            # SET LOCAL only lasts for this transaction, which is rolled back when the connection returns to the pool
+            conn.execute(text("SET LOCAL statement_timeout = 1000"))
+        conn.execute(text("SELECT 1"))
+
+
 async def _check_database() -> None:
     """Check database health."""
-    await db.session.execute(text("SELECT 1"))
+    await asyncio.to_thread(_ping_database)
 
 
 async def _check_vault() -> None:
     """Check Vault health."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            f"{vault_client.client.url}/v1/sys/health",
-            timeout=aiohttp.ClientTimeout(total=5),
-        ) as response:
-            if response.status != 200:
-                raise Exception(f"Vault returned status {response.status}")
+    response = await http_get(f"{vault_client.client.url}/v1/sys/health", timeout=HEALTH_CHECK_TIMEOUT)
+    if response.status_code != 200:
+        raise Exception(f"Vault returned status {response.status_code}")
 
 
 async def _check_redis() -> None:
     """Check Redis health."""
-    await asyncio.wait_for(cache.ping(), timeout=5.0)
+    await cache.ping()
 
 
 async def _check_keycloak() -> None:
     """Check Keycloak health."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            f"{Config.from_env().KEYCLOAK_URL}/health",
-            timeout=aiohttp.ClientTimeout(total=5),
-        ) as response:
-            if response.status != 200:
-                raise Exception(f"Keycloak returned status {response.status}")
+    response = await http_get(f"{Config.from_env().KEYCLOAK_URL}/health", timeout=HEALTH_CHECK_TIMEOUT)
+    if response.status_code != 200:
+        raise Exception(f"Keycloak returned status {response.status_code}")
 
 
 @bp.route("/health", methods=["GET"])
@@ -101,15 +123,15 @@ async def health_check():
     """Health check endpoint that checks all services.
 
     This endpoint checks the health of the database, Vault, Redis, and Keycloak
-    services. Each service check includes latency measurements and is performed
-    with appropriate timeouts.
+    services. The checks run concurrently, each with latency measurements and
+    a timeout of ``HEALTH_CHECK_TIMEOUT`` seconds.
 
     Returns:
         A JSON response with the health status of each service.
     """
     health_status = {
         "status": "healthy",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": datetime.now(timezone.utc),
         "services": {},
     }
 
@@ -121,9 +143,9 @@ async def health_check():
         "keycloak": _check_keycloak,
     }
 
-    # Perform all health checks
-    for service_name, check_func in service_checks.items():
-        service_status = await _check_service_health(service_name, check_func)
+    # Perform all health checks concurrently so latency is bounded by the slowest service
+    results = await asyncio.gather(*(_check_service_health(name, check_func) for name, check_func in service_checks.items()))
+    for service_name, service_status in zip(service_checks, results):
         health_status["services"][service_name] = service_status
         if service_status["status"] != "healthy":
             health_status["status"] = "unhealthy"
@@ -144,10 +166,10 @@ async def readiness_check():
     """
     try:
         # Check database connection
-        await db.session.execute(text("SELECT 1"))
+        await asyncio.to_thread(_ping_database)
         return jsonify({"status": "ready"}), 200
     except Exception as e:
-        current_app.logger.error(f"Readiness check failed: {str(e)}")
+        current_app.logger.error("Readiness check failed: %s", e)
         return jsonify({"status": "not ready", "error": str(e)}), 503
 
 
@@ -168,57 +190,49 @@ async def create_new_cluster():
     """
     try:
         # Validate request
-        data = CreateClusterRequest(**request.json)
+        data = CreateClusterRequest.model_validate_json(request.get_data(cache=False))
 
         # Create Redis lock key
         lock_key = f"cluster_creation:{data.name}"
 
         # Try to acquire lock with 10 second timeout
-        lock = cache.redis.lock(lock_key, timeout=600)  # 10 minute timeout
-        if not await lock.acquire(blocking=True, blocking_timeout=10):
+        lock = RedisLock(redis_client, lock_key, timeout=600)  # 10 minute timeout
+        if not await lock.acquire(blocking_timeout=10):
             raise ValidationError(f"Another cluster creation for {data.name} is in progress. Please wait.")
 
         try:
-            # Check if cluster exists in database
-            existing = await Cluster.query.filter_by(cluster_name=data.name).first()
-            if existing:
-                if not data.force:
-                    raise ResourceAlreadyExistsError(f"Cluster {data.name} already exists. Use force=true to recreate")
-                # If force=true, delete existing cluster and its resources
-                current_app.logger.warning(f"Force recreating existing cluster {data.name}")
-                async with db.session.begin_nested():
-                    # Delete associated resources in a single transaction
-                    await PlaybookExecution.query.filter_by(cluster_id=existing.id).delete()
-                    await db.session.delete(existing)
-                await db.session.commit()
+            if data.force:
+                # Delete any existing cluster in one statement; the database cascades to its executions
+                # and audit logs, and the delete commits together with the new records below
+                result = await asyncio.to_thread(db.session.execute, delete(Cluster).where(Cluster.name == data.name))
+                if result.rowcount:
+                    current_app.logger.warning("Force recreating existing cluster %s", data.name)
+            elif await asyncio.to_thread(Cluster.query.filter_by(name=data.name).first):
+                raise ResourceAlreadyExistsError(f"Cluster {data.name} already exists. Use force=true to recreate")
 
             # Check if cluster exists in inventory (required)
             inventory_url = current_app.config["INVENTORY_API_URL"]
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        f"{inventory_url}/clusters/{data.name}",
-                        timeout=30,  # 30 second timeout
-                    ) as response:
-                        if response.status == 404:
-                            raise ResourceNotFoundError(f"Cluster {data.name} not found in inventory")
-                        elif response.status != 200:
-                            raise ExternalServiceError(
-                                f"Inventory API returned status {response.status}",
-                                "inventory",
-                            )
-                        inventory_data = await response.json()
-            except aiohttp.ClientError as e:
-                raise ExternalServiceError(str(e), "inventory")
-            except asyncio.TimeoutError:
+                # Only the inventory id is forwarded; ask for just that field where the API supports it
+                response = await http_get(f"{inventory_url}/clusters/{data.name}", timeout=30, params={"fields": "id"})
+                if response.status_code == 404:
+                    raise ResourceNotFoundError(f"Cluster {data.name} not found in inventory")
+                elif response.status_code != 200:
+                    raise ExternalServiceError(
+                        f"Inventory API returned status {response.status_code}",
+                        "inventory",
+                    )
+                inventory_data = response.json()
+            except requests.Timeout:
                 raise ExternalServiceError("Inventory API request timed out", "inventory")
+            except requests.RequestException as e:
+                raise ExternalServiceError(str(e), "inventory")
 
             # Get kubeconfig based on provided source
             if data.kubeconfig_vault_path:
-                # Read vault token from sidecar file
+                # Read vault token from sidecar file (cached until the file changes)
                 try:
-                    with open("/vault/token", "r") as f:
-                        vault_token = f.read().strip()
+                    vault_token = vault_client.read_token_file()
                 except Exception as e:
                     raise ExternalServiceError(f"Failed to read vault token: {str(e)}", "vault")
 
@@ -227,15 +241,11 @@ async def create_new_cluster():
 
                 start_time = time.time()
                 try:
-                    async with vault_client.client.secrets.kv.v2.read_secret_version(
-                        path=data.kubeconfig_vault_path,
-                        mount_point=os.environ.get("VAULT_NAMESPACE", "default"),
-                    ) as response:
-                        await record_vault_operation("read_secret", start_time, True)
-                        vault_data = response.data.data
-                        kubeconfig_base64 = vault_data.get("kubeconfig")
-                        if not kubeconfig_base64:
-                            raise ValidationError(f"No kubeconfig found at Vault path: {data.kubeconfig_vault_path}")
+                    vault_data = await vault_client.read_kv_secret(data.kubeconfig_vault_path, os.environ.get("VAULT_NAMESPACE", "default"))
+                    await record_vault_operation("read_secret", start_time, True)
+                    kubeconfig_base64 = vault_data.get("kubeconfig")
+                    if not kubeconfig_base64:
+                        raise ValidationError(f"No kubeconfig found at Vault path: {data.kubeconfig_vault_path}")
                 except Exception as e:
                     await record_vault_operation("read_secret", start_time, False)
                     raise ExternalServiceError(str(e), "vault")
@@ -246,87 +256,54 @@ async def create_new_cluster():
 
             # Create cluster record
             cluster = Cluster(
-                cluster_name=data.name,
+                name=data.name,
                 service_account=data.service_account,
                 namespace=data.namespace,
                 status="creating",
             )
-            db.session.add(cluster)
-            await db.session.commit()
-
-            # Create playbook execution record with command info
-            execution = PlaybookExecution(
-                playbook_name="create_cluster.yml",
-                status="running",
-                cluster_id=cluster.id,
-                start_time=datetime.now(timezone.utc),
-                extra_vars=json.dumps(
-                    {
-                        "cluster_name": data.name,
-                        "service_account": data.service_account,
-                        "namespace": data.namespace,
-                        "kubeconfig_base64": kubeconfig_base64,  # Pass as base64
-                        "force": data.force,
-                        "overwrite": data.force,  # Set overwrite to match force flag
-                        "inventory_id": inventory_data.get("id"),  # Pass inventory data to playbook
-                        "inventory_metadata": inventory_data.get("metadata", {}),  # Pass any additional metadata
-                    },
-                    default=str,
-                ),
-                command="",  # Will be updated after playbook starts
-                pid=None,  # Will be updated after playbook starts
-                return_code=None,
-            )
-            db.session.add(execution)
-            await db.session.commit()
 
-            # Add kubeconfig and inventory data to extra vars
             extra_vars = {
                 "cluster_name": data.name,
                 "service_account": data.service_account,
                 "namespace": data.namespace,
-                "kubeconfig_base64": kubeconfig_base64,
+                "kubeconfig_base64": kubeconfig_base64,  # Pass as base64
                 "force": data.force,
                 "overwrite": data.force,  # Set overwrite to match force flag
                 "inventory_id": inventory_data.get("id"),  # Pass inventory data to playbook
-                "inventory_metadata": inventory_data.get("metadata", {}),  # Pass any additional metadata
             }
 
-            # Update execution record with prepared vars
-            execution.extra_vars = json.dumps(extra_vars, default=str)
-            await db.session.commit()
+            # Create playbook execution record with command info
+            execution = PlaybookExecution(
+                playbook_name="create_cluster.yml",
+                status="running",
+                cluster=cluster,
+                extra_vars=json.dumps(extra_vars, default=str),
+                command="",  # Will be updated after playbook starts
+                pid=None,  # Will be updated after playbook starts
+                return_code=None,
+            )
+            db.session.add_all([cluster, execution])
+            # Assign IDs and fetch server defaults, then capture the response fields before the
+            # commit expires them and reading them would need another SELECT
+            await asyncio.to_thread(db.session.flush)
+            cluster_payload = {
+                "id": cluster.id,
+                "name": cluster.name,
+                "status": cluster.status,
+                "created_at": cluster.created_at,
+                "updated_at": cluster.updated_at,
+            }
+            execution_payload = _execution_payload(execution, extra_vars)
+            await asyncio.to_thread(db.session.commit)
 
             # Run playbook
             playbook_path = os.path.join(current_app.config["PLAYBOOK_DIR"], "create_cluster.yml")
-
-            process, cmd_str = await run_playbook_async(playbook_path, extra_vars)
-            execution.command = cmd_str
-            execution.pid = process.pid
-            await db.session.commit()
+            cmd_str, pid = await _launch_recorded_playbook(execution, playbook_path, extra_vars)
+            execution_payload.update(command=cmd_str, pid=pid)
+            _evict_cluster_status(data.name)
 
             # Return response in documented format
-            return (
-                jsonify(
-                    {
-                        "id": cluster.id,
-                        "name": cluster.cluster_name,
-                        "status": cluster.status,
-                        "created_at": cluster.created_at.isoformat(),
-                        "updated_at": cluster.updated_at.isoformat(),
-                        "playbook_execution": {
-                            "id": execution.id,
-                            "status": execution.status,
-                            "playbook": execution.playbook_name,
-                            "start_time": execution.start_time.isoformat(),
-                            "extra_vars": json.loads(execution.extra_vars),
-                            "command": execution.command,
-                            "pid": execution.pid,
-                            "return_code": execution.return_code,
-                        },
-                    }
-                ),
-                201,
-            )
+            return jsonify({**cluster_payload, "playbook_execution": execution_payload}), 201
 
         except Exception as e:
             await log_request(
@@ -338,7 +315,7 @@ async def create_new_cluster():
             raise
         finally:
             # Release lock after completion or error
-            await lock.release()
+            lock.release()
 
     except Exception as e:
         await log_request(g.user_id, "create_cluster", f"Failed to create cluster: {str(e)}", "error")
@@ -361,19 +338,18 @@ async def update_service_account():
     """
     try:
         # Validate request
-        data = UpdateServiceAccountRequest(**request.json)
+        data = UpdateServiceAccountRequest.model_validate_json(request.get_data(cache=False))
 
         # Check if cluster exists
-        cluster = await Cluster.query.filter_by(cluster_name=data.cluster_name).first()
+        cluster = await asyncio.to_thread(Cluster.query.filter_by(name=data.cluster_name).first)
         if not cluster:
             raise ResourceNotFoundError(f"Cluster {data.cluster_name} not found")
 
         # Get kubeconfig based on provided source
         if data.kubeconfig_vault_path:
-            # Read vault token from sidecar file
+            # Read vault token from sidecar file (cached until the file changes)
             try:
-                with open("/vault/token", "r") as f:
-                    vault_token = f.read().strip()
+                vault_token = vault_client.read_token_file()
             except Exception as e:
                 raise ExternalServiceError(f"Failed to read vault token: {str(e)}", "vault")
 
@@ -382,15 +358,11 @@ async def update_service_account():
 
             start_time = time.time()
             try:
-                async with vault_client.client.secrets.kv.v2.read_secret_version(
-                    path=data.kubeconfig_vault_path,
-                    mount_point=os.environ.get("VAULT_NAMESPACE", "default"),
-                ) as response:
-                    await record_vault_operation("read_secret", start_time, True)
-                    vault_data = response.data.data
-                    kubeconfig_base64 = vault_data.get("kubeconfig")
-                    if not kubeconfig_base64:
-                        raise ValidationError(f"No kubeconfig found at Vault path: {data.kubeconfig_vault_path}")
+                vault_data = await vault_client.read_kv_secret(data.kubeconfig_vault_path, os.environ.get("VAULT_NAMESPACE", "default"))
+                await record_vault_operation("read_secret", start_time, True)
+                kubeconfig_base64 = vault_data.get("kubeconfig")
+                if not kubeconfig_base64:
+                    raise ValidationError(f"No kubeconfig found at Vault path: {data.kubeconfig_vault_path}")
             except Exception as e:
                 await record_vault_operation("read_secret", start_time, False)
                 raise ExternalServiceError(str(e), "vault")
@@ -401,65 +373,45 @@ async def update_service_account():
 
         # Update service account
         cluster.service_account = data.service_account
-        await db.session.commit()
+
+        extra_vars = {
+            "cluster_name": data.cluster_name,
+            "service_account": data.service_account,
+            "namespace": data.namespace,
+            "kubeconfig_base64": kubeconfig_base64,  # Pass as base64
+            "overwrite": True,  # Always overwrite when updating service account
+        }
 
         # Create playbook execution record
         execution = PlaybookExecution(
             playbook_name="update_service_account.yml",
             status="running",
             cluster_id=cluster.id,
-            start_time=datetime.now(timezone.utc),
-            extra_vars=json.dumps(
-                {
-                    "cluster_name": data.cluster_name,
-                    "service_account": data.service_account,
-                    "namespace": data.namespace,
-                    "kubeconfig_base64": kubeconfig_base64,  # Pass as base64
-                    "overwrite": True,  # Always overwrite when updating service account
-                },
-                default=str,
-            ),
+            extra_vars=json.dumps(extra_vars, default=str),
             command="",  # Will be updated after playbook starts
             pid=None,  # Will be updated after playbook starts
             return_code=None,
         )
         db.session.add(execution)
-        await db.session.commit()
+        # Assign the execution ID and capture the response fields before the commit expires them
+        await asyncio.to_thread(db.session.flush)
+        execution_payload = {**_execution_payload(execution, extra_vars), "cluster_id": cluster.id}
+        await asyncio.to_thread(db.session.commit)
 
         # Run playbook and update execution record
         playbook_path = os.path.join(current_app.config["PLAYBOOK_DIR"], "update_service_account.yml")
 
-        process, cmd_str = await run_playbook_async(
-            playbook_path,
-            {
-                "cluster_name": data.cluster_name,
-                "service_account": data.service_account,
-                "namespace": data.namespace,
-                "kubeconfig_base64": kubeconfig_base64,  # Pass as base64
-                "overwrite": True,  # Always overwrite when updating service account
-                "force": True,  # Always force when updating service account
-            },
-        )
-        execution.command = cmd_str
-        execution.pid = process.pid
-        await db.session.commit()
+        # Always force when updating service account
+        cmd_str, pid = await _launch_recorded_playbook(execution, playbook_path, {**extra_vars, "force": True})
+        execution_payload.update(command=cmd_str, pid=pid)
+        _evict_cluster_status(data.cluster_name)
 
         return (
             jsonify(
                 {
                     "message": f"Service account update started for cluster {data.cluster_name}",
-                    "execution_id": execution.id,
-                    "playbook_execution": {
-                        "id": execution.id,
-                        "status": execution.status,
-                        "playbook": execution.playbook_name,
-                        "start_time": execution.start_time.isoformat(),
-                        "extra_vars": json.loads(execution.extra_vars),
-                        "cluster_id": cluster.id,
-                        "command": execution.command,
-                        "pid": execution.pid,
-                        "return_code": execution.return_code,
-                    },
+                    "execution_id": execution_payload["id"],
+                    "playbook_execution": execution_payload,
                 }
             ),
             202,
@@ -475,9 +427,209 @@ async def update_service_account():
         raise
 
 
+async def _launch_recorded_playbook(execution: PlaybookExecution, playbook_path: str, extra_vars: Dict[str, Any]) -> Tuple[str, int]:
+    """Start the playbook for an execution that has already been committed.
+
+    Committing before the process starts means a playbook never runs for records that
+    were rolled back. The command and PID are saved afterwards in a second, short
+    transaction; if the process cannot be started, the execution is marked failed.
+
+    Args:
+        execution: The committed execution record.
+        playbook_path: Path to the playbook file.
+        extra_vars: Extra variables to pass to the playbook.
+
+    Returns:
+        Tuple[str, int]: The command line and the process ID of the playbook.
+    """
+    try:
+        process, cmd_str = await run_playbook_async(playbook_path, extra_vars)
+    except Exception:
+        execution.status = "failed"
+        await asyncio.to_thread(db.session.commit)
+        raise
+
+    execution.command = cmd_str
+    execution.pid = process.pid
+    await asyncio.to_thread(db.session.commit)
+    return cmd_str, process.pid
+
+
+def _execution_payload(execution: PlaybookExecution, extra_vars: Dict[str, Any]) -> Dict[str, Any]:
+    """Describe a playbook execution in the documented ``PlaybookExecutionResponse`` shape.
+
+    Timestamps are left as datetimes; the app's JSON provider renders them as ISO 8601.
+
+    Args:
+        execution: The playbook execution.
+        extra_vars: The variables to report for the execution.
+
+    Returns:
+        Dict[str, Any]: The execution details.
+    """
+    return {
+        "id": execution.id,
+        "status": execution.status,
+        "playbook": execution.playbook_name,
+        "start_time": execution.started_at,
+        "extra_vars": extra_vars,
+        "command": execution.command or "",
+        "pid": execution.pid,
+        "return_code": execution.return_code,
+    }
+
+
+def _stored_execution_payload(execution: PlaybookExecution) -> Dict[str, Any]:
+    """Describe a stored playbook execution with its secret variables removed.
+
+    Used by the status endpoints, whose responses are cached and visible to any
+    authenticated caller; only the create/update responses echo the variables they were given.
+
+    Args:
+        execution: The playbook execution.
+
+    Returns:
+        Dict[str, Any]: The execution details without secret variables.
+    """
+    extra_vars = json.loads(execution.extra_vars) if execution.extra_vars else {}
+    payload = _execution_payload(execution, _redact_extra_vars(extra_vars))
+    payload["command"] = _redact_command(payload["command"])
+    return payload
+
+
+def _redact_extra_vars(extra_vars: Dict[str, Any]) -> Dict[str, Any]:
+    """Return playbook variables without the ones that carry credentials.
+
+    Args:
+        extra_vars: The playbook variables.
+
+    Returns:
+        Dict[str, Any]: The variables without ``_SECRET_EXTRA_VARS``.
+    """
+    return {key: value for key, value in extra_vars.items() if key not in _SECRET_EXTRA_VARS}
+
+
+def _redact_command(command: str) -> str:
+    """Remove secret variables from the ``-e`` document of a stored playbook command line.
+
+    Commands recorded before they were built from redacted variables carry the full
+    ``-e`` JSON document, so stored commands are redacted again when they are reported.
+
+    Args:
+        command: The stored command line.
+
+    Returns:
+        str: The command line without secret variables.
+    """
+    if not command:
+        return command
+    args = shlex.split(command)
+    for i in range(1, len(args)):
+        if args[i - 1] != "-e":
+            continue
+        try:
+            extra_vars = json.loads(args[i])
+        except ValueError:
+            continue
+        if isinstance(extra_vars, dict):
+            args[i] = json.dumps(_redact_extra_vars(extra_vars), default=str)
+    return shlex.join(args)
+
+
+async def _load_cluster_status(cluster_name: str) -> Dict[str, Any]:
+    """Load the status of a cluster and its latest playbook execution from the database.
+
+    Args:
+        cluster_name: The name of the cluster to look up.
+
+    Returns:
+        Dict[str, Any]: The cluster status in ``ClusterStatusResponse`` form.
+
+    Raises:
+        ResourceNotFoundError: If the cluster does not exist.
+    """
+    cluster = await asyncio.to_thread(Cluster.query.filter_by(name=cluster_name).first)
+    if not cluster:
+        raise ResourceNotFoundError(f"Cluster {cluster_name} not found")
+
+    # Get latest playbook execution
+    latest_query = PlaybookExecution.query.filter_by(cluster_id=cluster.id).order_by(PlaybookExecution.started_at.desc())
+    latest_execution = await asyncio.to_thread(latest_query.first)
+
+    response = ClusterStatusResponse(
+        id=cluster.id,
+        name=cluster.name,
+        status=cluster.status,
+        created_at=cluster.created_at,
+        updated_at=cluster.updated_at,
+        playbook_execution=_stored_execution_payload(latest_execution) if latest_execution else None,
+    )
+    return response.model_dump()
+
+
+@ttl_memoize(maxsize=1024, ttl=5)
+async def _get_cluster_status(cluster_name: str) -> Dict[str, Any]:
+    """Get the status of a cluster, served from cache while the cluster is unchanged.
+
+    Results are cached in-process for a few seconds. Behind that, the shared cache is
+    keyed on the cluster's id, its ``updated_at`` and the id of its latest playbook
+    execution. Every create or update records a new execution, so a modification always
+    switches to a new key instead of serving the old status until it expires, even when
+    the cluster row itself is unchanged or ``updated_at`` does not move.
+
+    Args:
+        cluster_name: The name of the cluster to look up.
+
+    Returns:
+        Dict[str, Any]: The cluster status in ``ClusterStatusResponse`` form.
+
+    Raises:
+        ResourceNotFoundError: If the cluster does not exist.
+    """
+    probe = (
+        select(Cluster.id, Cluster.updated_at, func.max(PlaybookExecution.id))
+        .outerjoin(PlaybookExecution, PlaybookExecution.cluster_id == Cluster.id)
+        .where(Cluster.name == cluster_name)
+        .group_by(Cluster.id, Cluster.updated_at)
+    )
+    version = (await asyncio.to_thread(db.session.execute, probe)).one_or_none()
+    if version is None:
+        raise ResourceNotFoundError(f"Cluster {cluster_name} not found")
+
+    cluster_id, updated_at, latest_execution_id = version
+    key = f"cluster_status:{cluster_name}:{cluster_id}:{latest_execution_id}:{updated_at.isoformat()}"
+    try:
+        status = cache.get(key)
+    except Exception as e:
+        current_app.logger.warning("Failed to read cached status for cluster %s: %s", cluster_name, e)
+        status = None
+    if status is None:
+        status = await _load_cluster_status(cluster_name)
+        latest = status["playbook_execution"]
+        # A playbook that is still being launched records its PID without adding an execution,
+        # which would not change the key, so that short window is never shared
+        if latest is None or latest["pid"] is not None or latest["status"] != "running":
+            try:
+                cache.set(key, status, timeout=60)
+            except Exception as e:
+                current_app.logger.warning("Failed to cache status for cluster %s: %s", cluster_name, e)
+    return status
+
+
+def _evict_cluster_status(cluster_name: str) -> None:
+    """Drop the in-process status for a cluster after it has been modified.
+
+    Entries in the shared cache need no eviction; they are keyed on the cluster's latest
+    playbook execution, which every modification adds.
+
+    Args:
+        cluster_name: The name of the modified cluster.
+    """
+    _get_cluster_status.evict(cluster_name)
+
+
 @bp.route("/check_cluster_status/<cluster_name>")
 @limiter.limit("60/minute")
-@cache.memoize(timeout=60)
 @track_request_metrics()
 @auth_manager.login_required
 async def check_cluster_status(cluster_name: str):
@@ -497,23 +649,7 @@ async def check_cluster_status(cluster_name: str):
         if not cluster_name:
             raise ValidationError("Cluster name is required")
 
-        cluster = await Cluster.query.filter_by(cluster_name=cluster_name).first()
-        if not cluster:
-            raise ResourceNotFoundError(f"Cluster {cluster_name} not found")
-
-        # Get latest playbook execution
-        latest_execution = await PlaybookExecution.query.filter_by(cluster_id=cluster.id).order_by(PlaybookExecution.start_time.desc()).first()
-
-        response = ClusterStatusResponse(
-            id=cluster.id,
-            name=cluster.cluster_name,
-            status=cluster.status,
-            created_at=cluster.created_at.isoformat(),
-            updated_at=cluster.updated_at.isoformat(),
-            playbook_execution=latest_execution.to_dict() if latest_execution else None,
-        )
-
-        return jsonify(response.dict()), 200
+        return jsonify(await _get_cluster_status(cluster_name)), 200
 
     except Exception as e:
         await log_request(
@@ -540,22 +676,30 @@ async def check_status():
         A JSON response with the cluster statuses.
     """
     try:
-        clusters = await Cluster.query.all()
+        # Fetch every cluster with its latest execution in one query instead of one query per cluster
+        ranked = select(
+            PlaybookExecution,
+            func.row_number().over(partition_by=PlaybookExecution.cluster_id, order_by=PlaybookExecution.started_at.desc()).label("rank"),
+        ).subquery()
+        latest = aliased(PlaybookExecution, ranked)
+        query = (
+            select(Cluster, latest)
+            .outerjoin(latest, and_(latest.cluster_id == Cluster.id, ranked.c.rank == 1))
+            .options(raiseload("*"))
+        )
+        rows = (await asyncio.to_thread(db.session.execute, query)).all()
         response = []
 
-        for cluster in clusters:
-            # Get latest playbook execution for each cluster
-            latest_execution = await PlaybookExecution.query.filter_by(cluster_id=cluster.id).order_by(PlaybookExecution.start_time.desc()).first()
-
+        for cluster, latest_execution in rows:
             status = ClusterStatusResponse(
                 id=cluster.id,
-                name=cluster.cluster_name,
+                name=cluster.name,
                 status=cluster.status,
-                created_at=cluster.created_at.isoformat(),
-                updated_at=cluster.updated_at.isoformat(),
-                playbook_execution=(latest_execution.to_dict() if latest_execution else None),
+                created_at=cluster.created_at,
+                updated_at=cluster.updated_at,
+                playbook_execution=(_stored_execution_payload(latest_execution) if latest_execution else None),
             )
-            response.append(status.dict())
+            response.append(status.model_dump())
 
         return jsonify(response), 200
 
@@ -578,23 +722,25 @@ async def run_playbook_async(playbook_path: str, extra_vars: Dict[str, Any]) ->
         extra_vars: Additional variables to pass to the playbook.
 
     Returns:
-        Tuple[subprocess.Popen, str]: The running playbook process and the command string.
+        Tuple[subprocess.Popen, str]: The running playbook process and the command string,
+        without secret variables.
     """
     playbook_name = os.path.basename(playbook_path)
     with track_playbook_execution(playbook_name):
-        cmd = ["ansible-playbook", playbook_path]
-        for key, value in extra_vars.items():
-            cmd.extend(["-e", f"{key}={shlex.quote(str(value))}"])
-
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=os.environ.copy(),
+        # A single JSON document keeps every value intact (spaces, newlines, nested data);
+        # the argv goes straight to exec, so no shell quoting is involved
+        cmd = ["ansible-playbook", playbook_path, "-e", json.dumps(extra_vars, default=str)]
+
+        # Spawn with a plain Popen: an asyncio subprocess transport is tied to the request's
+        # event loop and kills the child when it is closed, but the playbook must outlive the
+        # request. Nothing reads its output, so discard it rather than let a full pipe block it.
+        process = await asyncio.get_running_loop().run_in_executor(
+            _PLAYBOOK_EXECUTOR,
+            partial(subprocess.Popen, cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL),
         )
 
-        # Return both process and command string for logging
-        return process, " ".join(cmd)
+        # The command string is stored and reported, so it is built from the redacted variables
+        return process, shlex.join(cmd[:-1] + [json.dumps(_redact_extra_vars(extra_vars), default=str)])
 
 
 @contextmanager
@@ -56,7 +56,7 @@ def callback():
 
         return redirect(url_for("main.index"))
     except Exception as e:
-        current_app.logger.error(f"Token exchange error: {str(e)}")
+        current_app.logger.error("Token exchange error: %s", e)
         return jsonify({"error": "Authentication failed"}), 401
 
 
@@ -80,7 +80,10 @@ def get_vault_token():
 @bp.route("/logout")
 def logout():
     """Log out the user."""
-    # Clear session
+    # Drop cached auth data for the token and clear session
+    access_token = session.get("access_token")
+    if access_token:
+        auth_manager.forget_token(access_token)
     session.clear()
 
     # Get provider type
@@ -1,6 +1,7 @@
 """Request and response schemas for the API endpoints."""
 
 import base64
+from datetime import datetime
 from typing import Dict, Optional
 
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -144,7 +145,7 @@ class PlaybookExecutionResponse(BaseModel):
     id: int = Field(..., description="Execution ID")
     status: str = Field(..., description="Execution status")
     playbook: str = Field(..., description="Playbook name")
-    start_time: str = Field(..., description="Start time in ISO format")
+    start_time: datetime = Field(..., description="Start time, serialized in ISO format")
     command: str = Field(..., description="Executed command")
     pid: Optional[int] = Field(None, description="Process ID if running")
     return_code: Optional[int] = Field(None, description="Return code if completed")
@@ -157,6 +158,6 @@ class ClusterStatusResponse(BaseModel):
     id: int = Field(..., description="Cluster ID")
     name: str = Field(..., description="Cluster name")
     status: str = Field(..., description="Current cluster status")
-    created_at: str = Field(..., description="Creation timestamp")
-    updated_at: str = Field(..., description="Last update timestamp")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
     playbook_execution: Optional[PlaybookExecutionResponse] = Field(None, description="Latest playbook execution details")
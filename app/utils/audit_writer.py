@@ -0,0 +1,159 @@
+"""Background writer that batches audit log inserts across requests."""
+
+import atexit
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from flask import current_app
+
+from .monitoring import AUDIT_LOG_DROPPED
+
+
+class AuditLogWriter:
+    """Queue audit log rows and insert them in batches from a single writer thread.
+
+    Requests only enqueue a row; the writer drains up to ``MAX_BATCH`` rows, or
+    whatever has arrived within ``FLUSH_INTERVAL`` seconds, and writes them with
+    one executemany INSERT and one commit. When the queue is full, producers
+    block until the writer catches up. A failed batch is retried with backoff and
+    then written row by row, so one bad row only loses itself; rows that still
+    fail are counted in ``audit_log_dropped_total``.
+
+    Attributes:
+        MAX_BATCH (int): Maximum number of rows written per transaction.
+        FLUSH_INTERVAL (float): Seconds to wait for more rows before writing a partial batch.
+        MAX_QUEUE_SIZE (int): Number of pending rows at which producers start to block.
+        MAX_ATTEMPTS (int): Attempts to write a whole batch before falling back to single rows.
+        RETRY_BACKOFF (float): Seconds to wait before the first retry; doubled for each further retry.
+    """
+
+    MAX_BATCH = 500
+    FLUSH_INTERVAL = 2.0
+    MAX_QUEUE_SIZE = 10000
+    MAX_ATTEMPTS = 3
+    RETRY_BACKOFF = 0.5
+
+    def __init__(self):
+        """Initialize the writer without an application."""
+        self._app = None
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=self.MAX_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._atexit_registered = False
+
+    def init_app(self, app):
+        """Bind the writer to an application.
+
+        Args:
+            app (Flask): The Flask application whose database receives the rows.
+        """
+        self._app = app
+        # The writer is shared by every app created in the process; flush it once at exit
+        if not self._atexit_registered:
+            atexit.register(self.flush)
+            self._atexit_registered = True
+
+    def put(self, row: Dict[str, Any]) -> None:
+        """Queue an audit log row for writing.
+
+        Args:
+            row (Dict[str, Any]): Column values for an ``AuditLog`` row.
+        """
+        self._ensure_thread()
+        self._queue.put(row)
+
+    def flush(self) -> None:
+        """Write every queued row now, e.g. on shutdown."""
+        while True:
+            batch = self._drain()
+            if not batch:
+                return
+            self._write(batch)
+
+    def _ensure_thread(self) -> None:
+        """Start the writer thread in this process if it is not running.
+
+        Started lazily so that each forked worker gets its own thread.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+                self._thread.start()
+
+    def _drain(self, first: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Take up to ``MAX_BATCH`` queued rows without waiting.
+
+        Args:
+            first (Optional[Dict[str, Any]]): A row already taken from the queue.
+
+        Returns:
+            List[Dict[str, Any]]: The rows to write.
+        """
+        batch = [first] if first is not None else []
+        while len(batch) < self.MAX_BATCH:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        """Write batches until the process exits."""
+        while True:
+            try:
+                first = self._queue.get(timeout=self.FLUSH_INTERVAL)
+            except queue.Empty:
+                continue
+            self._write(self._drain(first))
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        """Insert a batch of rows, retrying and then falling back to one row at a time.
+
+        Args:
+            batch (List[Dict[str, Any]]): The rows to insert.
+        """
+        from .. import db
+
+        with self._app.app_context():
+            try:
+                for attempt in range(self.MAX_ATTEMPTS):
+                    if attempt:
+                        time.sleep(self.RETRY_BACKOFF * 2 ** (attempt - 1))
+                    if self._insert(batch):
+                        return
+
+                # A single bad row fails the whole batch; write rows one at a time so only it is lost
+                dropped = sum(1 for row in batch if not self._insert([row]))
+                if dropped:
+                    AUDIT_LOG_DROPPED.inc(dropped)
+                    current_app.logger.error("Dropped %d of %d audit log entries", dropped, len(batch))
+            finally:
+                db.session.remove()
+
+    def _insert(self, rows: List[Dict[str, Any]]) -> bool:
+        """Insert rows in one transaction.
+
+        Args:
+            rows (List[Dict[str, Any]]): The rows to insert.
+
+        Returns:
+            bool: Whether the rows were committed.
+        """
+        from .. import db
+        from ..models import AuditLog
+
+        try:
+            db.session.execute(AuditLog.__table__.insert(), rows)
+            db.session.commit()
+            return True
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.warning("Failed to write %d audit log entries: %s", len(rows), e)
+            return False
+
+
+audit_writer = AuditLogWriter()
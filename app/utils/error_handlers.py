@@ -18,7 +18,7 @@ def handle_validation_error(error: Exception) -> Tuple[Dict[str, Any], int]:
     Returns:
         Tuple containing the error response and HTTP status code
     """
-    current_app.logger.warning(f"Validation error: {str(error)}")
+    current_app.logger.warning("Validation error: %s", error)
     return jsonify({"error": str(error)}), 400
 
 
@@ -31,7 +31,7 @@ def handle_resource_not_found_error(error: Exception) -> Tuple[Dict[str, Any], i
     Returns:
         Tuple containing the error response and HTTP status code
     """
-    current_app.logger.warning(f"Resource not found: {str(error)}")
+    current_app.logger.warning("Resource not found: %s", error)
     return jsonify({"error": str(error)}), 404
 
 
@@ -44,7 +44,7 @@ def handle_resource_exists_error(error: Exception) -> Tuple[Dict[str, Any], int]
     Returns:
         Tuple containing the error response and HTTP status code
     """
-    current_app.logger.warning(f"Resource already exists: {str(error)}")
+    current_app.logger.warning("Resource already exists: %s", error)
     return jsonify({"error": str(error)}), 409
 
 
@@ -57,7 +57,7 @@ def handle_external_service_error(error: Exception) -> Tuple[Dict[str, Any], int
     Returns:
         Tuple containing the error response and HTTP status code
     """
-    current_app.logger.error(f"External service error: {str(error)}")
+    current_app.logger.error("External service error: %s", error)
     return jsonify({"error": str(error)}), 502
 
 
@@ -70,7 +70,7 @@ def handle_authentication_error(error: Exception) -> Tuple[Dict[str, Any], int]:
     Returns:
         Tuple containing the error response and HTTP status code
     """
-    current_app.logger.warning(f"Authentication error: {str(error)}")
+    current_app.logger.warning("Authentication error: %s", error)
     return jsonify({"error": str(error)}), 401
 
 
@@ -83,5 +83,5 @@ def handle_internal_error(error: Exception) -> Tuple[Dict[str, Any], int]:
     Returns:
         Tuple containing the error response and HTTP status code
     """
-    current_app.logger.error(f"Internal server error: {str(error)}")
+    current_app.logger.error("Internal server error: %s", error)
     return jsonify({"error": "Internal server error"}), 500
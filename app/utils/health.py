@@ -1,20 +1,21 @@
 """Health check utilities."""
 
+import asyncio
 from datetime import datetime, timezone
 from typing import Any, Dict
 
-import aiohttp
-import hvac
 from flask import current_app
 from sqlalchemy.sql import text
 
+from .http_client import http_get
+
 
 async def check_database_health() -> bool:
     """Check database connectivity."""
     try:
         from .. import db
 
-        result = await db.session.execute(text("SELECT 1"))
+        result = await asyncio.to_thread(db.session.execute, text("SELECT 1"))
         return bool(result.scalar())
     except Exception:
         return False
@@ -23,6 +24,8 @@ async def check_database_health() -> bool:
 async def check_vault_health() -> bool:
     """Check Vault connectivity and status."""
     try:
+        import hvac
+
         client = hvac.Client(
             url=current_app.config["VAULT_ADDR"],
             token=current_app.config["VAULT_TOKEN"],
@@ -36,9 +39,8 @@ async def check_kubernetes_health() -> bool:
     """Check Kubernetes API connectivity."""
     try:
         api_url = current_app.config["K8S_API_URL"]
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{api_url}/healthz") as response:
-                return response.status == 200
+        response = await http_get(f"{api_url}/healthz", timeout=5)
+        return response.status_code == 200
     except Exception:
         return False
 
@@ -53,7 +55,7 @@ async def get_system_health() -> Dict[str, Any]:
 
     return {
         "status": "healthy" if all(checks.values()) else "unhealthy",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": datetime.now(timezone.utc),
         "checks": checks,
         "details": {
             "database": {
@@ -0,0 +1,34 @@
+"""Shared HTTP client for calls to external services."""
+
+import asyncio
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# One pooled session for the whole process. Flask runs every async view on its own
+# short-lived event loop, so an aiohttp session cannot outlive a request; a requests
+# session driven from a worker thread keeps its keep-alive connections across requests.
+http_session = requests.Session()
+http_session.headers.update({"Accept": "application/json"})
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=100)
+http_session.mount("https://", _adapter)
+http_session.mount("http://", _adapter)
+
+
+async def http_get(url: str, timeout: float, **kwargs: Any) -> requests.Response:
+    """Issue a GET request on the shared session without blocking the event loop.
+
+    Args:
+        url (str): The URL to request.
+        timeout (float): Connect and read timeout in seconds.
+        **kwargs (Any): Additional arguments passed to ``requests.Session.get``.
+
+    Returns:
+        requests.Response: The response, with its body already read.
+
+    Raises:
+        requests.Timeout: If the request timed out.
+        requests.RequestException: If the request failed.
+    """
+    return await asyncio.to_thread(http_session.get, url, timeout=timeout, **kwargs)
@@ -0,0 +1,74 @@
+"""JSON serialization for Flask responses backed by orjson."""
+
+import decimal
+from typing import Any, Union
+
+import orjson
+from flask.json.provider import JSONProvider
+
+# Stored timestamps are UTC; naive values (e.g. from SQLite) are rendered as UTC too
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively.
+
+    Args:
+        obj (Any): The object to serialize.
+
+    Returns:
+        Any: A JSON-serializable representation of the object.
+
+    Raises:
+        TypeError: If the object cannot be serialized.
+    """
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that encodes with orjson.
+
+    Datetimes are emitted as ISO 8601 strings in a single encoding pass, so
+    models can hand raw ``datetime`` values to ``jsonify``.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as JSON.
+
+        Args:
+            obj (Any): The data to serialize.
+            **kwargs (Any): Ignored; accepted for interface compatibility.
+
+        Returns:
+            str: The JSON document.
+        """
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize data as JSON.
+
+        Args:
+            s (Union[str, bytes]): The JSON document.
+            **kwargs (Any): Ignored; accepted for interface compatibility.
+
+        Returns:
+            Any: The decoded data.
+        """
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Serialize the given arguments as JSON and return a response with the ``application/json`` mimetype.
+
+        Args:
+            *args (Any): A single value, or several values treated as a list.
+            **kwargs (Any): Treated as a dict to serialize.
+
+        Returns:
+            Response: The JSON response.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS), mimetype="application/json")
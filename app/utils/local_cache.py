@@ -0,0 +1,85 @@
+"""In-process caching helpers."""
+
+import asyncio
+import threading
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from cachetools import TTLCache
+
+
+class _Flight:
+    """A call in progress whose result concurrent callers wait for."""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        """Initialize an unfinished call."""
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def ttl_memoize(maxsize: int = 1024, ttl: float = 5) -> Callable:
+    """Memoize a single-argument coroutine function in a per-process TTL cache.
+
+    Hits are served from memory without touching the shared cache. Concurrent
+    misses for the same key are coalesced: the first caller runs the function and
+    the others wait for its result. Flask runs each async view on its own event
+    loop, so waiters block on a ``threading.Event`` in a worker thread rather
+    than awaiting a future from another loop.
+
+    The wrapped function gains an ``evict(key)`` attribute for dropping an entry
+    after a mutation; entries in other processes expire after ``ttl`` seconds.
+
+    Args:
+        maxsize (int): Maximum number of cached entries. Defaults to 1024.
+        ttl (float): Seconds an entry stays cached. Defaults to 5.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(f: Callable) -> Callable:
+        entries: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        in_flight: Dict[Hashable, _Flight] = {}
+        lock = threading.Lock()
+
+        @wraps(f)
+        async def wrapper(key: Hashable) -> Any:
+            with lock:
+                value = entries.get(key)
+                if value is not None:
+                    return value
+                flight = in_flight.get(key)
+                leader = flight is None
+                if leader:
+                    flight = in_flight[key] = _Flight()
+
+            if not leader:
+                await asyncio.to_thread(flight.done.wait)
+                if flight.error is not None:
+                    raise flight.error
+                return flight.value
+
+            try:
+                flight.value = await f(key)
+                with lock:
+                    entries[key] = flight.value
+                return flight.value
+            except BaseException as e:
+                flight.error = e
+                raise
+            finally:
+                with lock:
+                    in_flight.pop(key, None)
+                flight.done.set()
+
+        def evict(key: Hashable) -> None:
+            with lock:
+                entries.pop(key, None)
+
+        wrapper.evict = evict
+        return wrapper
+
+    return decorator
@@ -49,6 +49,11 @@ VAULT_OPERATION_COUNT = Counter(
     ["operation", "status"],
 )
 
+AUDIT_LOG_DROPPED = Counter(
+    "audit_log_dropped_total",
+    "Audit log entries that could not be written",
+)
+
 
 def track_request_metrics() -> Callable:
     """Decorator to track request metrics."""
@@ -0,0 +1,72 @@
+"""Distributed lock built on a single Redis SET NX PX command."""
+
+import asyncio
+import random
+import time
+import uuid
+from typing import Optional
+
+import redis
+
+# Delete the key only if it still holds our token, so an expired lock re-acquired
+# by another worker is never released by us
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class RedisLock:
+    """A lock held in Redis under ``key`` until released or ``timeout`` expires.
+
+    Acquiring is one ``SET key token NX PX`` round-trip; releasing is one Lua
+    script call that checks the token.
+
+    Attributes:
+        key (str): The Redis key holding the lock.
+        timeout (float): Seconds after which Redis drops an unreleased lock.
+    """
+
+    def __init__(self, client: redis.Redis, key: str, timeout: float):
+        """Initialize the lock without acquiring it.
+
+        Args:
+            client (redis.Redis): The Redis client to use.
+            key (str): The Redis key holding the lock.
+            timeout (float): Seconds after which Redis drops an unreleased lock.
+        """
+        self.client = client
+        self.key = key
+        self.timeout = timeout
+        self._release_script = client.register_script(_RELEASE_SCRIPT)
+        self._token: Optional[str] = None
+
+    async def acquire(self, blocking_timeout: float = 0) -> bool:
+        """Try to take the lock, retrying with jittered sleeps for up to ``blocking_timeout`` seconds.
+
+        Args:
+            blocking_timeout (float): Seconds to keep retrying. Defaults to 0 (a single attempt).
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + blocking_timeout
+        delay = 0.05
+        while True:
+            if self.client.set(self.key, token, nx=True, px=int(self.timeout * 1000)):
+                self._token = token
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(remaining, random.uniform(0, delay)))
+            delay = min(delay * 2, 1.0)
+
+    def release(self) -> None:
+        """Release the lock if this instance still holds it."""
+        if self._token is not None:
+            self._release_script(keys=[self.key], args=[self._token])
+            self._token = None
@@ -8,17 +8,30 @@ Required environment variables:
     VAULT_ADDR: Alternative to VAULT_URL (for compatibility)
 """
 
+import asyncio
 import os
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
-import hvac
+from cachetools import TTLCache
+
+if TYPE_CHECKING:
+    import hvac
+
+# Where the Vault agent sidecar writes its token
+VAULT_TOKEN_FILE = "/vault/token"
 
 
 class VaultClient:
     """Singleton class for Vault client."""
 
     _instance = None
-    _client: Optional[hvac.Client] = None
+    _client: Optional["hvac.Client"] = None
+    # Short-lived copies of KV secrets, keyed by (mount_point, path)
+    _kv_cache: TTLCache = TTLCache(maxsize=256, ttl=30)
+    _kv_cache_lock = threading.Lock()
+    # Token last read from the sidecar file, with the file's path and modification time
+    _file_token: Optional[Tuple[str, int, str]] = None
 
     def __new__(cls):
         """Ensure only one instance of VaultClient exists."""
@@ -27,7 +40,7 @@ class VaultClient:
         return cls._instance
 
     @property
-    def client(self) -> hvac.Client:
+    def client(self) -> "hvac.Client":
         """Get or create the hvac client instance.
 
         Returns:
@@ -42,6 +55,8 @@ class VaultClient:
             if not vault_url:
                 raise ValueError("Neither VAULT_URL nor VAULT_ADDR environment variables are set")
 
+            import hvac
+
             self._client = hvac.Client(
                 url=vault_url,
                 verify=True,  # Verify SSL by default
@@ -57,6 +72,56 @@ class VaultClient:
         """
         return os.environ.get("VAULT_URL") or os.environ.get("VAULT_ADDR", "")
 
+    def read_token_file(self, path: str = VAULT_TOKEN_FILE) -> str:
+        """Read the token written by the Vault agent sidecar.
+
+        The file is only re-read when its modification time changes, so the
+        per-request cost is a single ``stat`` call.
+
+        Args:
+            path (str): Path of the token file. Defaults to ``VAULT_TOKEN_FILE``.
+
+        Returns:
+            str: The Vault token.
+
+        Raises:
+            OSError: If the token file cannot be read.
+        """
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._file_token
+        if cached is not None and cached[0] == path and cached[1] == mtime:
+            return cached[2]
+        with open(path, "r") as f:
+            token = f.read().strip()
+        self._file_token = (path, mtime, token)
+        return token
+
+    async def read_kv_secret(self, path: str, mount_point: str) -> Dict[str, Any]:
+        """Read the latest version of a KV v2 secret.
+
+        The blocking hvac call runs in a worker thread, and results are cached for
+        a short time so repeated reads of the same path make a single request.
+
+        Args:
+            path (str): Path of the secret within the mount.
+            mount_point (str): The KV v2 mount point.
+
+        Returns:
+            Dict[str, Any]: The secret's key/value data.
+
+        Raises:
+            hvac.exceptions.VaultError: If Vault rejects the request.
+        """
+        key = (mount_point, path)
+        with self._kv_cache_lock:
+            data = self._kv_cache.get(key)
+        if data is None:
+            response = await asyncio.to_thread(self.client.secrets.kv.v2.read_secret_version, path=path, mount_point=mount_point)
+            data = response["data"]["data"]
+            with self._kv_cache_lock:
+                self._kv_cache[key] = data
+        return dict(data)
+
 
 # Create singleton instance
 vault_client = VaultClient()
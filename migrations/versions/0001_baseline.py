@@ -0,0 +1,72 @@
+"""Baseline schema
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0001_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases created by db.create_all() before migrations were introduced already have
+    # these tables; only create what is missing so they can be brought under migration control
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "cluster" not in existing:
+        op.create_table(
+            "cluster",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(length=255), nullable=False),
+            sa.Column("kubeconfig", sa.Text(), nullable=True),
+            sa.Column("kubeconfig_vault_path", sa.String(length=255), nullable=True),
+            sa.Column("service_account", sa.String(length=255), nullable=False),
+            sa.Column("namespace", sa.String(length=255), nullable=False),
+            sa.Column("status", sa.String(length=50), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("name", name="cluster_name_key"),
+        )
+
+    if "playbook_execution" not in existing:
+        op.create_table(
+            "playbook_execution",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("playbook_name", sa.String(length=255), nullable=False),
+            sa.Column("status", sa.String(length=50), nullable=False),
+            sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("result", sa.Text(), nullable=True),
+            sa.Column("cluster_id", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(["cluster_id"], ["cluster.id"], name="playbook_execution_cluster_id_fkey"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    if "audit_log" not in existing:
+        op.create_table(
+            "audit_log",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("timestamp", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("user_id", sa.String(length=255), nullable=False),
+            sa.Column("action", sa.String(length=255), nullable=False),
+            sa.Column("details", sa.Text(), nullable=True),
+            sa.Column("status", sa.String(length=50), nullable=True),
+            sa.Column("cluster_id", sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(["cluster_id"], ["cluster.id"], name="audit_log_cluster_id_fkey"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+
+def downgrade():
+    op.drop_table("audit_log")
+    op.drop_table("playbook_execution")
+    op.drop_table("cluster")
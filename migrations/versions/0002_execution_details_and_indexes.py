@@ -0,0 +1,82 @@
+"""Execution details, server-side timestamps and query indexes
+
+Revision ID: 0002_execution_details_and_indexes
+Revises: 0001_baseline
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0002_execution_details_and_indexes"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+# (name, type) of the nullable columns recording how each playbook was launched
+_NEW_EXECUTION_COLUMNS = (
+    ("extra_vars", sa.Text),
+    ("command", sa.Text),
+    ("pid", sa.Integer),
+    ("return_code", sa.Integer),
+)
+
+# (name, table, columns, dialect options)
+_INDEXES = (
+    ("ix_audit_log_user_id", "audit_log", ["user_id"], {}),
+    ("ix_audit_log_status", "audit_log", ["status"], {}),
+    ("ix_audit_log_cluster_id", "audit_log", ["cluster_id"], {}),
+    ("ix_cluster_status", "cluster", ["status"], {}),
+    ("ix_playbook_execution_status", "playbook_execution", ["status"], {}),
+    (
+        "ix_playbook_execution_cluster_started",
+        "playbook_execution",
+        ["cluster_id", sa.text("started_at DESC")],
+        {"postgresql_include": ["status"]},
+    ),
+    ("ix_audit_log_timestamp_brin", "audit_log", ["timestamp"], {"postgresql_using": "brin"}),
+    ("ix_playbook_execution_started_brin", "playbook_execution", ["started_at"], {"postgresql_using": "brin"}),
+)
+
+# (table, column) pairs that are now stamped by the database
+_SERVER_TIMESTAMPS = (
+    ("audit_log", "timestamp"),
+    ("cluster", "created_at"),
+    ("cluster", "updated_at"),
+    ("playbook_execution", "started_at"),
+)
+
+
+def upgrade():
+    # Tables created by db.create_all() from the current models already have some of this
+    inspector = sa.inspect(op.get_bind())
+    execution_columns = {column["name"] for column in inspector.get_columns("playbook_execution")}
+
+    with op.batch_alter_table("playbook_execution") as batch_op:
+        for name, type_ in _NEW_EXECUTION_COLUMNS:
+            if name not in execution_columns:
+                batch_op.add_column(sa.Column(name, type_(), nullable=True))
+
+    for table, column in _SERVER_TIMESTAMPS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.DateTime(timezone=True), existing_nullable=False, server_default=sa.func.now())
+
+    existing_indexes = {index["name"] for table in ("audit_log", "cluster", "playbook_execution") for index in inspector.get_indexes(table)}
+    for name, table, columns, options in _INDEXES:
+        if name not in existing_indexes:
+            op.create_index(name, table, columns, **options)
+
+
+def downgrade():
+    for name, table, _columns, _options in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
+
+    for table, column in _SERVER_TIMESTAMPS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.DateTime(timezone=True), existing_nullable=False, server_default=None)
+
+    with op.batch_alter_table("playbook_execution") as batch_op:
+        for name, _type in reversed(_NEW_EXECUTION_COLUMNS):
+            batch_op.drop_column(name)
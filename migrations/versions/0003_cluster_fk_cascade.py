@@ -0,0 +1,36 @@
+"""Cascade cluster deletes to executions and audit entries
+
+Revision ID: 0003_cluster_fk_cascade
+Revises: 0002_execution_details_and_indexes
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0003_cluster_fk_cascade"
+down_revision = "0002_execution_details_and_indexes"
+branch_labels = None
+depends_on = None
+
+# Matches PostgreSQL's default constraint names so SQLite's unnamed reflected keys can be addressed too
+_NAMING_CONVENTION = {"fk": "%(table_name)s_%(column_0_name)s_fkey"}
+
+_CHILD_TABLES = ("playbook_execution", "audit_log")
+
+
+def _replace_cluster_fk(ondelete):
+    for table in _CHILD_TABLES:
+        name = f"{table}_cluster_id_fkey"
+        with op.batch_alter_table(table, naming_convention=_NAMING_CONVENTION) as batch_op:
+            batch_op.drop_constraint(name, type_="foreignkey")
+            batch_op.create_foreign_key(name, "cluster", ["cluster_id"], ["id"], ondelete=ondelete)
+
+
+def upgrade():
+    _replace_cluster_fk("CASCADE")
+
+
+def downgrade():
+    _replace_cluster_fk(None)
@@ -0,0 +1,60 @@
+"""Tests for the cluster API routes."""
+
+import asyncio
+import json
+import shlex
+import subprocess
+
+import pytest
+
+from app import create_app, routes
+from app.models import PlaybookExecution
+
+KUBECONFIG = "a3ViZWNvbmZpZy1zZWNyZXQtdmFsdWU="
+
+
+@pytest.fixture
+def app():
+    """Create an application configured for tests."""
+    return create_app("testing")
+
+
+def test_status_payload_never_contains_kubeconfig(app, monkeypatch):
+    """The stored command and variables of an execution must not expose the kubeconfig."""
+    monkeypatch.setattr(subprocess, "Popen", lambda *args, **kwargs: type("Process", (), {"pid": 4242})())
+    extra_vars = {"cluster_name": "demo", "kubeconfig_base64": KUBECONFIG}
+
+    with app.app_context():
+        process, command = asyncio.run(routes.run_playbook_async("/playbooks/create_cluster.yml", extra_vars))
+        assert KUBECONFIG not in command
+
+        execution = PlaybookExecution(
+            id=1,
+            playbook_name="create_cluster.yml",
+            status="running",
+            extra_vars=json.dumps(extra_vars),
+            command=command,
+            pid=process.pid,
+        )
+        response = app.json.response(routes._stored_execution_payload(execution))
+
+    assert KUBECONFIG not in response.get_data(as_text=True)
+
+
+def test_status_payload_redacts_commands_stored_before_redaction(app):
+    """Commands recorded with the full ``-e`` document are redacted when reported."""
+    extra_vars = {"cluster_name": "demo", "kubeconfig_base64": KUBECONFIG}
+    execution = PlaybookExecution(
+        id=1,
+        playbook_name="create_cluster.yml",
+        status="running",
+        extra_vars=json.dumps(extra_vars),
+        command=shlex.join(["ansible-playbook", "create_cluster.yml", "-e", json.dumps(extra_vars)]),
+    )
+
+    with app.app_context():
+        payload = routes._stored_execution_payload(execution)
+        response = app.json.response(payload)
+
+    assert KUBECONFIG not in response.get_data(as_text=True)
+    assert json.loads(shlex.split(payload["command"])[-1]) == {"cluster_name": "demo"}